@@ -0,0 +1,90 @@
+"""
+Throughput of bulk writes: one request per record against multi-path updates
+
+Runs against the in-memory storage, with a simulated round trip per request so the
+numbers reflect what the request count costs against the real database:
+
+    python -m backend.benchmark_writes --records 2000 --latency-ms 40
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.logic.storage import MemoryStorage
+
+class LatencyStorage(MemoryStorage):
+    """MemoryStorage that sleeps for a network round trip on every request"""
+    def __init__(self, latency):
+        super().__init__()
+        self.latency = latency
+        self.requests = 0
+
+    def _round_trip(self):
+        self.requests += 1
+        time.sleep(self.latency)
+
+    def set(self, path, value):
+        self._round_trip()
+        super().set(path, value)
+
+    def update(self, path, values):
+        self._round_trip()
+        super().update(path, values)
+
+    def query(self, path, **kwargs):
+        self._round_trip()
+        return super().query(path, **kwargs)
+
+def make_records(count):
+    return [
+        {"username": f"player{i}", "email": f"player{i}@example.com", "default_mode_highscore": i % 50}
+        for i in range(count)
+    ]
+
+def run(name, storage, function):
+    storage.requests = 0
+    start = time.perf_counter()
+    count = function()
+    elapsed = time.perf_counter() - start
+    print(f"{name:<32}{count:>8} records{storage.requests:>8} requests{elapsed:>10.3f} s{count / elapsed:>12.0f} records/s")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--records", type=int, default=1000)
+    parser.add_argument("--latency-ms", type=float, default=40.0, help="simulated round trip per request")
+    args = parser.parse_args()
+
+    records = make_records(args.records)
+    storage = LatencyStorage(args.latency_ms / 1000)
+
+    def push_each():
+        # What create_multiple used to do: one push (a set with a new key) per record
+        for record in records:
+            storage.push("users", record)
+        return len(records)
+
+    def push_many():
+        return len(storage.push_many("users", records))
+
+    def delete_each():
+        keys = list(storage.query("users", order_by="default_mode_highscore", equal_to=0))
+        for key in keys:
+            storage.delete(f"users/{key}")
+        return len(keys)
+
+    def delete_many():
+        keys = list(storage.query("users", order_by="default_mode_highscore", equal_to=1))
+        storage.delete_many("users", keys)
+        return len(keys)
+
+    print(f"Simulated round trip: {args.latency_ms:.0f} ms")
+    run("create, one push per record", storage, push_each)
+    run("create, multi-path update", storage, push_many)
+    run("delete, one request per key", storage, delete_each)
+    run("delete, multi-path update", storage, delete_many)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+"""
+Export every /users record as JSON lines, streaming page by page
+
+    python -m backend.export_users users.jsonl --page-size 500
+"""
+import argparse
+import json
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("output", nargs="?", help="file to write, stdout if omitted")
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--shallow", action="store_true", help="list all user IDs before reading records")
+    args = parser.parse_args()
+
+    # Initializes Firebase from the environment on import
+    from backend.firebase_config import FirebaseCRUD
+
+    output = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    count = 0
+    try:
+        for uid, record in FirebaseCRUD().iter_all(page_size=args.page_size, shallow=args.shallow):
+            output.write(json.dumps({"uid": uid, **(record or {})}) + "\n")
+            count += 1
+    finally:
+        if args.output:
+            output.close()
+    print(f"Exported {count} users", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -6,7 +6,7 @@ from dotenv import load_dotenv
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from PyQt6.QtWidgets import QApplication, QMainWindow, QWidget, QVBoxLayout, QLabel, QPushButton, QButtonGroup
-from src.scenes.menu.menu_window import Menu
+from src.scenes.app_shell import AppShell
 
 # Import firebase_config to initialize Firebase (this will handle initialization)
 from backend.firebase_config import firebase_config
@@ -20,8 +20,9 @@ def main() -> None:
     # Firebase is already initialized by importing firebase_config
     # No need to initialize again here
     
-    window = Menu()
-    window.show()
+    # The menu and the game scene live in one AppShell, as in src/main.py
+    window = AppShell()
+    window.showFullScreen()
     
     # Start the event loop
     sys.exit(app.exec())
@@ -102,19 +103,23 @@ firebase_config = FirebaseConfig()
 
 from firebase_admin import db, auth
 from backend.firebase_config import firebase_config
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Iterator, Tuple
 from backend.firebase_listeners import FirebaseListener
 from backend.firebase_exceptions import handle_firebase_error
+from src.core.logic.storage import AdminStorage
 import time
 import os
 import uuid
 from dotenv import load_dotenv
 
 class FirebaseCRUD:
-    def __init__(self):
+    def __init__(self, storage=None):
         # No need to load dotenv or initialize Firebase here
         # firebase_config already handles this
         self.ref = db.reference("/users")
+        self.path = "users"
+        # Bulk writes go through the storage interface, so they can run locally too
+        self.storage = storage if storage is not None else AdminStorage()
 
     def create_user(self, email, password, username):
         try:
@@ -200,18 +205,17 @@ class FirebaseCRUD:
         """
         Create multiple records at once
         
+        Push IDs are generated locally and the records written as multi-path updates,
+        one request per chunk instead of one push per record.
+        
         Args:
             data_list: List of dictionaries to store
             
         Returns:
             List of created record IDs
         """
-        created_ids = []
         try:
-            for data in data_list:
-                record_id = self.create(data)
-                created_ids.append(record_id)
-            return created_ids
+            return self.storage.push_many(self.path, data_list)
             
         except Exception as e:
             print(f"Error creating multiple records: {e}")
@@ -240,17 +244,32 @@ class FirebaseCRUD:
         """
         Read all records in the collection
         
+        Pages through the collection instead of downloading it in one response, but
+        still builds one dict; use iter_all to process records in constant memory.
+        
         Returns:
             Dictionary with all records (key: record_id, value: record_data)
         """
         try:
-            data = self.ref.get()
-            return data if data else {}
+            return dict(self.iter_all())
             
         except Exception as e:
             print(f"Error reading all records: {e}")
             return {}
     
+    def iter_all(self, page_size: int = 100, shallow: bool = False) -> Iterator[Tuple[str, Any]]:
+        """
+        Yield every record in the collection, one page at a time
+        
+        Args:
+            page_size: Records per request
+            shallow: Fetch all record IDs first, then the records in ranges of them
+            
+        Returns:
+            Iterator of (record_id, record_data) in key order
+        """
+        return self.storage.iter_children(self.path, page_size=page_size, shallow=shallow)
+    
     def read_filtered(self, field: str, value: Any, limit: Optional[int] = None) -> Dict[str, Any]:
         """
         Read records filtered by field value
@@ -367,13 +386,9 @@ class FirebaseCRUD:
             if not records_to_delete:
                 return 0
             
-            # Delete each record
-            deleted_count = 0
-            for record_id in records_to_delete.keys():
-                if self.delete(record_id):
-                    deleted_count += 1
-            
-            return deleted_count
+            # Delete them all as multi-path updates with None values
+            self.storage.delete_many(self.path, list(records_to_delete.keys()))
+            return len(records_to_delete)
             
         except Exception as e:
             print(f"Error deleting filtered records: {e}")
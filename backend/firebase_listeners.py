@@ -1,13 +1,22 @@
 from firebase_admin import db
 from backend.firebase_config import firebase_config
+import itertools
 import threading
 from typing import Callable, Optional
 
 class FirebaseListener:
+    """
+    Realtime listeners on a collection
+
+    Callbacks run on firebase_admin's SSE threads, so they must not touch Qt widgets;
+    the game uses src.core.logic.listeners.ListenerManager, which hands events to the
+    GUI thread.
+    """
     def __init__(self, collection_name: str = ''):
         self.collection_name = collection_name
         self.ref = firebase_config.get_database_reference(collection_name)
-        self.listeners = {}
+        self.listeners = {}  # listener id -> ListenerRegistration
+        self.ids = itertools.count()
     
     def listen_to_changes(self, callback: Callable, child_path: str = '') -> str:
         """
@@ -29,9 +38,8 @@ class FirebaseListener:
             ref = self.ref
             
         # Add listener
-        listener_id = f"listener_{len(self.listeners)}"
-        ref.listen(listener)
-        self.listeners[listener_id] = ref
+        listener_id = f"listener_{next(self.ids)}"
+        self.listeners[listener_id] = ref.listen(listener)
         
         return listener_id
     
@@ -64,15 +72,17 @@ class FirebaseListener:
                 if on_child_changed:
                     on_child_changed(event.data, event.path)
         
-        listener_id = f"child_listener_{len(self.listeners)}"
-        self.ref.listen(event_listener)
-        self.listeners[listener_id] = self.ref
+        listener_id = f"child_listener_{next(self.ids)}"
+        self.listeners[listener_id] = self.ref.listen(event_listener)
         
         return listener_id
     
     def remove_listener(self, listener_id: str):
-        """Remove a specific listener"""
-        if listener_id in self.listeners:
-            # Note: firebase-admin doesn't have a direct way to remove listeners
-            # You would need to keep track of the listener reference
-            del self.listeners[listener_id]
\ No newline at end of file
+        """Remove a specific listener and close its stream"""
+        registration = self.listeners.pop(listener_id, None)
+        if registration is not None:
+            registration.close()
+
+    def remove_all_listeners(self):
+        for listener_id in list(self.listeners):
+            self.remove_listener(listener_id)
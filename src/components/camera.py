@@ -1,22 +1,24 @@
 # the widget of the camera
 import sys
 import cv2
-import mediapipe as mp
 import math
+from itertools import product
 
 from PyQt6.QtWidgets import QMainWindow, QWidget, QLabel, QVBoxLayout, QSizePolicy
 from PyQt6.QtCore import Qt, QTimer 
 from PyQt6.QtGui import QImage, QPixmap
 
-from src.core.gestures.wink_detector import WinkDetector
-
 from src.core.logic.abstract_functions import get_resource_path
-
-from src.core.gestures.gesture_decoder import GestureDecoder
+from src.core.logic.perception import PerceptionStack
 from src.components.overlay_label import OverlayLabel
 
+# Display strings for every possible one-hand gesture, keyed by the decoder output.
+# The decoder reports fingers thumb-first, the player reads them pinky-first.
+BINARY_STRINGS = {bits: ''.join(str(bit) for bit in reversed(bits)) for bits in product((0, 1), repeat=5)}
+FINGER_COUNTS = {bits: str(sum(bits)) for bits in product((0, 1), repeat=5)}
+
 class Camera_Widget(QWidget):
-    def __init__(self, parent=None, code=None):
+    def __init__(self, parent=None, code=None, perception=None):
         super().__init__(parent)
         self.resize(550, 500)
 
@@ -25,12 +27,16 @@ class Camera_Widget(QWidget):
         self.validation_method = "click"
         self.parent = parent
 
-        self.wink_detector = WinkDetector()
+        # Camera and models normally come warmed up from the menu's PerceptionLoader
+        self.owns_perception = perception is None
+        self.perception = perception if perception is not None else PerceptionStack()
+        self.perception.set_number_of_hands(self.number_of_hands)
+        self.wink_detector = self.perception.wink_detector
         self.previous_wink_detection = False
         # Initialize camera
-        self.capture = cv2.VideoCapture(0)
-        if not self.capture.isOpened():
+        if not self.perception.open_camera():
             raise IOError("Failed to open camera. Please check permissions.")
+        self.capture = self.perception.capture
 
         # Set up layout
         main_layout = QVBoxLayout()
@@ -63,10 +69,10 @@ class Camera_Widget(QWidget):
         self.timer.start(30)  # Update every 30 ms
         
         # Set up mediapipe
-        self.mp_hands = mp.solutions.hands
-        self.initialize_hands_detector()
-        self.mp_drawing = mp.solutions.drawing_utils
-        self.gesture_decoder = GestureDecoder()
+        self.mp_hands = self.perception.mp_hands
+        self.hands = self.perception.hands
+        self.mp_drawing = self.perception.mp_drawing
+        self.gesture_decoder = self.perception.gesture_decoder
         
         # Store previous gestures to avoid redundant updates
         self.current_gesture = None
@@ -74,19 +80,16 @@ class Camera_Widget(QWidget):
         # Keep track of detected hands count for UI adjustments
         self.detected_hands_count = 0
 
+        # The result label is only touched once a decoded value held for a few frames
+        self.displayed_result = ""
+        self.pending_result = ""
+        self.pending_result_frames = 0
+        self.result_stable_frames = 2
+
     def initialize_hands_detector(self):
-        """Initialize or reinitialize the MediaPipe Hands detector with current settings"""
-        # Close existing hands detector if it exists
-        if hasattr(self, 'hands'):
-            self.hands.close()
-            
-        # Create a new hands detector with current settings
-        self.hands = self.mp_hands.Hands(
-            static_image_mode=False,
-            max_num_hands=self.number_of_hands,
-            min_detection_confidence=0.5,
-            min_tracking_confidence=0.5
-        )
+        """Reinitialize the MediaPipe Hands detector if the number of hands changed"""
+        self.perception.set_number_of_hands(self.number_of_hands)
+        self.hands = self.perception.hands
     
     def update_true_code(self, new_code):
         """Update the widget with a new binary code"""
@@ -104,7 +107,7 @@ class Camera_Widget(QWidget):
         print(f"Number of hands updated to: {new_number_of_hands}")
     
     def update_result_label_size(self, hands_count):
-        """Update the result label size based on the number of detected hands"""
+        """Update the result label size based on the number of displayed hands"""
         # Only resize if the hands count has changed
         if hands_count != self.detected_hands_count:
             self.detected_hands_count = hands_count
@@ -114,31 +117,34 @@ class Camera_Widget(QWidget):
             else:
                 self.resultText_label.setFixedSize(200, 80)
 
-    def ResultInText(self, list_data):
+    def format_result(self, list_data):
+        """Turn the decoded gestures into the text shown under the camera feed"""
         if not list_data:
-            self.resultText_label.setText("")
-            return
-
-        # Reverse the gestures to display them in the correctly
-        list_data = [gesture[::-1] for gesture in list_data]
+            return ""
+        keys = [tuple(gesture) for gesture in list_data]
         if self.parent.current_game_mode == "reverse":
-            # Count open fingers per hand
-            finger_counts = [sum(gesture) for gesture in list_data]
-
             # If exactly two hands are detected, sum both (e.g., 2 + 5 = 7)
-            if len(finger_counts) == 2:
-                total = sum(finger_counts)
-                result_string = str(total)
-            else:
-                # Show individual counts separated by space (for 1 or more than 2 hands)
-                result_string = ' '.join(str(count) for count in finger_counts)
-        else:
-            # For other modes: convert each gesture to binary string, e.g., [1,0,0,1,0] -> "10010"
-            gesture_strings = [''.join(str(bit) for bit in gesture) for gesture in list_data]
-            result_string = ' '.join(gesture_strings)
+            if len(keys) == 2:
+                return str(sum(keys[0]) + sum(keys[1]))
+            # Show individual counts separated by space (for 1 or more than 2 hands)
+            return ' '.join(FINGER_COUNTS[key] for key in keys)
+        # For other modes: each gesture as a binary string, e.g. [0,1,0,0,1] -> "10010"
+        return ' '.join(BINARY_STRINGS[key] for key in keys)
+
+    def ResultInText(self, list_data):
+        """Show the decoded gestures once the value is stable and differs from the label"""
+        result_string = self.format_result(list_data)
+        if result_string != self.pending_result:
+            self.pending_result = result_string
+            self.pending_result_frames = 0
+        self.pending_result_frames += 1
+        if self.pending_result_frames < self.result_stable_frames or result_string == self.displayed_result:
+            return
 
+        self.displayed_result = result_string
+        self.update_result_label_size(len(list_data) if result_string else 0)
         self.resultText_label.setText(result_string)
-    
+
     def update_frame(self):
         # Read a frame from the camera
         ret, frame = self.capture.read()
@@ -171,18 +177,12 @@ class Camera_Widget(QWidget):
                     and self.parent.elaborate_answer.isHidden():
                         self.parent.validate_current_code()                    
                
-        # Update UI label size based on number of hands
-        self.update_result_label_size(len(multi_hand_gestures))
-
         # Always update current_gesture
         self.current_gesture = multi_hand_gestures if multi_hand_gestures else []
         self.previous_wink_detection = self.current_wink_detection
 
-        # Show raw gesture data in label
-        if multi_hand_gestures:
-            self.ResultInText(self.current_gesture)
-        else:
-            self.resultText_label.setText("")
+        # Show gesture data in label (only relayouts when the value changes)
+        self.ResultInText(self.current_gesture)
             
         # Convert the frame to a QImage
         height, width, channel = frame_rgb.shape
@@ -209,19 +209,14 @@ class Camera_Widget(QWidget):
         if not hasattr(self, 'current_gesture') or not self.current_gesture:
             return ""
 
-        # Convert each gesture list to a binary string
-        gesture_strings = [''.join(str(bit) for bit in gesture) for gesture in self.current_gesture]
-
-        # Join with space if multiple hands
-        result = ' '.join(gesture_strings)
-        #flip the result array
-        result = result[::-1]
+        # Flipped result: hands in reverse order, each gesture read pinky-first
+        result = ' '.join(BINARY_STRINGS[tuple(gesture)] for gesture in reversed(self.current_gesture))
         print(f"Current code: {result}")
         return result
 
     def closeEvent(self, event):
         self.timer.stop()
-        if hasattr(self, 'hands'):
-            self.hands.close()
-        self.capture.release()
+        # A shared stack stays open for the next game; the loader releases it on quit
+        if self.owns_perception:
+            self.perception.close()
         event.accept()
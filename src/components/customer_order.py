@@ -2,9 +2,9 @@ import random
 import os
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel
 from PyQt6.QtGui import QPixmap, QTransform
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QSize
 
-from src.core.logic.abstract_functions import get_resource_path
+from src.core.logic.asset_cache import AssetCache
 
 class CustomerOrder(QWidget):
     def __init__(self, parent=None):
@@ -27,12 +27,12 @@ class CustomerOrder(QWidget):
         self.container.setMinimumSize(400, 300)
         
         # Set up speech bubble background
-        bubble_image_path = get_resource_path("img/bubble.png")
         self.bubble_label = QLabel(self.container)
         
         try:
-            self.bubble_image = QPixmap(bubble_image_path).scaled(
-                350, 250, Qt.AspectRatioMode.KeepAspectRatio
+            self.bubble_image = AssetCache.instance().pixmap(
+                "img/bubble.png", QSize(350, 250),
+                Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.FastTransformation
             )
             # Set up mirrored bubble image
             self.bubble_image = self.bubble_image.transformed(QTransform().scale(-1, 1))
@@ -98,19 +98,17 @@ class CustomerOrder(QWidget):
             # Store current order
             self.order = self.path
             
-            # Load and scale the image
-            menu_image_path = get_resource_path(f"img/menu/")
-            menu_image_path += "/" + self.path + ".png"
-            self.menu_image = QPixmap(menu_image_path)
+            # Scaled image comes from the shared asset cache
+            menu_image_name = f"img/menu/{self.path}.png"
+            self.menu_image = AssetCache.instance().pixmap(
+                menu_image_name, QSize(200, 200),
+                Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.FastTransformation
+            )
             
             if self.menu_image.isNull():
-                print(f"Error: Failed to load menu image from {menu_image_path}")
+                print(f"Error: Failed to load menu image {menu_image_name}")
                 self.menu_image_label.setText("Image not found")
                 return False
-                
-            self.menu_image = self.menu_image.scaled(
-                200, 200, Qt.AspectRatioMode.KeepAspectRatio
-            )
             
             # Update the label
             self.menu_image_label.setPixmap(self.menu_image)
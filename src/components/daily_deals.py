@@ -1,12 +1,20 @@
 import random
-import os
+from pathlib import Path
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QHBoxLayout, QFrame
 )
 from PyQt6.QtGui import QPixmap
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QSize
 
-from src.core.logic.abstract_functions import get_resource_path
+from src.core.logic.asset_cache import AssetCache
+
+ROW_COUNT = 5
+CODE_STYLE = """
+    font-family: 'Comic Sans MS';
+    font-size: 28pt;
+    font-weight: bold;
+    color: white;
+"""
 
 class DailyDealsLabel(QLabel):
     def __init__(self, parent=None, current_game_mode=None):
@@ -19,8 +27,11 @@ class DailyDealsLabel(QLabel):
         self.images = []
         self.images_in_file = []
         
-        # Initialize the layout property
+        # Rows are created once and updated in place on every refresh
         self.order = None
+        self.rows = []
+        self.separators = []
+        self._build_rows()
         
         # Load available menu images
         self.load_available_images()
@@ -45,30 +56,52 @@ class DailyDealsLabel(QLabel):
         
         return binary_array
        
+    def _build_rows(self):
+        """Create the fixed pool of rows (image left, code right) with separators between them"""
+        self.order = QVBoxLayout(self)
+        for i in range(ROW_COUNT):
+            row = QWidget(self)
+            order_row = QHBoxLayout(row)
+            order_row.setContentsMargins(0, 0, 0, 0)
+
+            image_label = QLabel(row)
+            image_label.setFixedSize(100, 100)
+            image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            order_row.addWidget(image_label)
+            order_row.addStretch(1)
+
+            code_label = QLabel(row)
+            code_label.setStyleSheet(CODE_STYLE)
+            code_label.setMargin(10)
+            order_row.addWidget(code_label)
+
+            row.hide()
+            self.order.addWidget(row)
+            self.rows.append((row, image_label, code_label))
+
+            if i < ROW_COUNT - 1:
+                separator = QFrame(self)
+                separator.setFrameShape(QFrame.Shape.HLine)
+                separator.setFrameShadow(QFrame.Shadow.Sunken)
+                separator.hide()
+                self.order.addWidget(separator)
+                self.separators.append(separator)
+
     def load_available_images(self):
-        """Load all available menu images from the img directory"""
-        try:
-            self.menu_dir = get_resource_path("img/menu/")
-            if os.path.exists(self.menu_dir):
-                self.images_in_file = [img.split('.')[0] for img in os.listdir(self.menu_dir) 
-                                    if img.endswith(".png")]
-            else:
-                self.images_in_file = []
-        except Exception as e:
-            self.images_in_file = []
+        """Load the names of all available menu images; the set does not change while running"""
+        self.images_in_file = [
+            Path(name).stem for name in AssetCache.available_assets("img/menu") if name.endswith(".png")
+        ]
     
     def randomize_menu_images(self):
         """Select random menu images for the daily deals"""
         try:
-            # Reload available images in case they changed
-            self.load_available_images()
-            
             if not self.images_in_file:
                 return
                 
             # Check if we have enough images
             total_images = len(self.images_in_file)
-            needed_images = 5 
+            needed_images = ROW_COUNT
             if total_images < needed_images:
                 # Fill with available images, might have duplicates
                 self.images = random.choices(self.images_in_file, k=needed_images)
@@ -111,23 +144,6 @@ class DailyDealsLabel(QLabel):
             self.codes = []
             self.images = []
             
-            # Clear any existing layout
-            if hasattr(self, 'order') and self.order is not None:
-                # Remove all widgets from the existing layout
-                while self.order.count():
-                    item = self.order.takeAt(0)
-                    if item.widget():
-                        item.widget().deleteLater()
-                    elif item.layout():
-                        # Also clear nested layouts
-                        while item.layout().count():
-                            nested_item = item.layout().takeAt(0)
-                            if nested_item.widget():
-                                nested_item.widget().deleteLater()
-                
-                # Delete the existing layout by transferring ownership
-                QWidget().setLayout(self.order)
-            
             # Generate new menu content
             self.randomize_menu_images()
             
@@ -141,6 +157,7 @@ class DailyDealsLabel(QLabel):
                 
             # Ensure we have both images and codes before continuing
             if not self.images or not self.codes:
+                self._update_rows()
                 return
                 
             # Make sure images and codes have the same length
@@ -148,63 +165,31 @@ class DailyDealsLabel(QLabel):
             self.images = self.images[:min_length]
             self.codes = self.codes[:min_length]
             
-            # Main vertical layout for all orders
-            self.order = QVBoxLayout()
-            
-            # Create each individual order
-            for i in range(len(self.images)):
-                # Create horizontal layout for each order (image left, code right)
-                order_row = QHBoxLayout()
-                
-                # Add the menu image
-                try:
-                    image_path = get_resource_path(f"img/menu/")
-                    image_path += "/" + self.images[i] + ".png"
-                    menu_image = QPixmap(image_path)
-                    
-                    if menu_image.isNull():
-                        image_label = QLabel("?")
-                        image_label.setStyleSheet("background-color: gray;")
-                        image_label.setFixedSize(100, 100)
-                    else:
-                        image_label = QLabel()
-                        image_label.setPixmap(menu_image.scaled(100, 100, Qt.AspectRatioMode.KeepAspectRatio))
-                        
-                    order_row.addWidget(image_label)
-                except Exception as e:
-                    label = QLabel("Error")
-                    label.setStyleSheet("background-color: red;")
-                    order_row.addWidget(label)
-
-                # Add spacer
-                order_row.addStretch(1)
-                
-                # Add the code
-                try:
-                    code_label = QLabel(str(self.codes[i]))
-                    code_label.setStyleSheet("""
-                        font-family: 'Comic Sans MS';
-                        font-size: 28pt;
-                        font-weight: bold;
-                        color: white;
-                    """)
-                    code_label.setMargin(10)
-                    order_row.addWidget(code_label)
-                except Exception as e:
-                    return                
-                # Add this horizontal layout to the main vertical layout
-                self.order.addLayout(order_row)
-                
-                # Add a horizontal separator line if not the last item
-                if i < len(self.images) - 1:
-                    separator = QFrame()
-                    separator.setFrameShape(QFrame.Shape.HLine)
-                    separator.setFrameShadow(QFrame.Shadow.Sunken)
-                    self.order.addWidget(separator)
-            
-            # Set the layout and update the widget
-            self.setLayout(self.order)
-            self.update()
+            self._update_rows()
             
         except Exception as e:
-            return
\ No newline at end of file
+            return
+
+    def _update_rows(self):
+        """Show the current images and codes in the row pool, hiding unused rows"""
+        for i, (row, image_label, code_label) in enumerate(self.rows):
+            visible = i < min(len(self.images), len(self.codes))
+            row.setVisible(visible)
+            if i > 0:
+                self.separators[i - 1].setVisible(visible)
+            if not visible:
+                continue
+
+            menu_image = AssetCache.instance().pixmap(
+                f"img/menu/{self.images[i]}.png", QSize(100, 100),
+                Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.FastTransformation
+            )
+            if menu_image.isNull():
+                image_label.setPixmap(QPixmap())
+                image_label.setText("?")
+                image_label.setStyleSheet("background-color: gray;")
+            else:
+                if image_label.styleSheet():
+                    image_label.setStyleSheet("")
+                image_label.setPixmap(menu_image)
+            code_label.setText(str(self.codes[i]))
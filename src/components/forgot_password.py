@@ -11,7 +11,8 @@ class ForgotPassword(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.parent = parent
-        self.fdb = FirebaseCRUD()
+        # Share the auth handler's client instead of initializing another one
+        self.fdb = parent.fdb if hasattr(parent, 'fdb') else FirebaseCRUD()
         self._setup_ui()
         self._initialize_elements()
 
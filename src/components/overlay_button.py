@@ -2,11 +2,15 @@ from PyQt6.QtWidgets import QPushButton
 from PyQt6.QtGui import QFont, QPixmap, QPainter, QTransform
 from PyQt6.QtCore import Qt
 
+from src.core.logic.pixmap_cache import load_pixmap, scaled_pixmap
+
 class OverlayButton(QPushButton):
     def __init__(self, text, parent=None, path=None):
         super().__init__(text, parent)
         self.setMinimumSize(200, 60)
         self.path = path
+        self.flipped = False
+        self._scaled_background = None
         
         # Set font
         font = QFont("Comic Sans MS")
@@ -42,11 +46,8 @@ class OverlayButton(QPushButton):
             painter = QPainter(self)
             
             # First draw the background image
-            painter.drawPixmap(self.rect(), self.background_img.scaled(
-                self.size(), 
-                Qt.AspectRatioMode.KeepAspectRatio, 
-                Qt.TransformationMode.SmoothTransformation
-            ))
+            painter.drawPixmap(self.rect(), self.scaled_background())
+            painter.end()
             
             # Then let the parent class draw everything else (text, borders, etc.)
             # We need to call the parent's paintEvent to ensure text is applied
@@ -55,6 +56,18 @@ class OverlayButton(QPushButton):
             # If no image, just use the default paint event
             super().paintEvent(event)
 
+    def resizeEvent(self, event):
+        self._scaled_background = None
+        super().resizeEvent(event)
+
+    def scaled_background(self):
+        """Background image scaled to the current size, rescaled only after a resize or image change"""
+        if self._scaled_background is None or self._scaled_background[0] != self.size():
+            source_key = f"{self.path}:flipped" if self.flipped else self.path
+            pixmap = scaled_pixmap(self.background_img, self.size(), source_key=source_key)
+            self._scaled_background = (self.size(), pixmap)
+        return self._scaled_background[1]
+
     # def setText(self, text):
     #     self.text = text
     #     self.adjustSize()
@@ -65,10 +78,12 @@ class OverlayButton(QPushButton):
         """Update the button's image to a new one"""
         if self.background_img is not None:
             try:
-                new_background_img = QPixmap(new_image_path)
+                new_background_img = load_pixmap(new_image_path)
                 if not new_background_img.isNull():
                     self.background_img = new_background_img
                     self.path = new_image_path
+                    self.flipped = False
+                    self._scaled_background = None
                     print(f"Successfully loaded image: {new_image_path}")
                     
                     # Update style to transparent when setting a new image
@@ -99,6 +114,8 @@ class OverlayButton(QPushButton):
                 transform.scale(-1, 1)  # Flip horizontally
                 flipped_pixmap = self.background_img.transformed(transform, Qt.TransformationMode.SmoothTransformation)
                 self.background_img = flipped_pixmap
+                self.flipped = not self.flipped
+                self._scaled_background = None
                 self.update()  # Schedule a repaint
             else:
                 print("No image to flip")
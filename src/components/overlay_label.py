@@ -2,6 +2,8 @@ from PyQt6.QtWidgets import QLabel, QSizePolicy
 from PyQt6.QtGui import QFont, QPixmap, QPainter, QColor
 from PyQt6.QtCore import Qt, QSize
 
+from src.core.logic.pixmap_cache import load_pixmap, scaled_pixmap
+
 class OverlayLabel(QLabel):
     def __init__(self, text, parent=None, path=None):
         super().__init__(parent)
@@ -9,6 +11,8 @@ class OverlayLabel(QLabel):
         self.text = text
         self.textColor = QColor("white")  # Default text color
         self.background_img = QPixmap()
+        self.path = path
+        self._scaled_background = None
 
         # Set font properly
         font = QFont()
@@ -18,7 +22,7 @@ class OverlayLabel(QLabel):
         self.setFont(font)
 
         if path:
-            self.background_img.load(path)
+            self.background_img = load_pixmap(path)
 
         # Apply styling
         if path:
@@ -52,6 +56,8 @@ class OverlayLabel(QLabel):
         )
 
     def setText(self, text):
+        if text == self.text:
+            return
         self.text = text
         self.adjustSize()
         self.updateGeometry()
@@ -70,19 +76,23 @@ class OverlayLabel(QLabel):
     def minimumSizeHint(self):
         return self.sizeHint()
 
+    def resizeEvent(self, event):
+        self._scaled_background = None
+        super().resizeEvent(event)
+
+    def scaled_background(self):
+        """Background image scaled to the current size, rescaled only after a resize"""
+        if self._scaled_background is None or self._scaled_background[0] != self.size():
+            pixmap = scaled_pixmap(self.background_img, self.size(), source_key=self.path)
+            self._scaled_background = (self.size(), pixmap)
+        return self._scaled_background[1]
+
     def paintEvent(self, event):
         painter = QPainter(self)
 
         # Draw background image if available
         if not self.background_img.isNull():
-            painter.drawPixmap(
-                self.rect(),
-                self.background_img.scaled(
-                    self.size(),
-                    Qt.AspectRatioMode.KeepAspectRatio,
-                    Qt.TransformationMode.SmoothTransformation
-                )
-            )
+            painter.drawPixmap(self.rect(), self.scaled_background())
 
         # Draw text with current text color
         painter.setFont(self.font())
@@ -15,7 +15,8 @@ class Register(QWidget):
         self.parent = parent
         self._setup_ui()
         self._initialize_elements()
-        self.fdb = FirebaseCRUD()
+        # Share the auth handler's client instead of initializing another one
+        self.fdb = parent.fdb if hasattr(parent, 'fdb') else FirebaseCRUD()
 
     def _setup_ui(self):
         """Initialize the basic UI components"""
@@ -6,6 +6,7 @@ from src.components.overlay_label import OverlayLabel
 from src.components.overlay_button import OverlayButton
 from src.components.notification import show_notification
 from src.core.logic.abstract_functions import get_resource_path
+from src.core.logic.leaderboard import GAME_MODES
 
 class UserPage(QWidget):
     def __init__(self, parent=None):
@@ -72,6 +73,23 @@ class UserPage(QWidget):
         self.scores_label.setWordWrap(True)
         self.scores_label.setMinimumHeight(200)
 
+        # Leaderboard Section
+        leaderboard_subtitle = OverlayLabel("Leaderboard")
+        font = QFont("Comic Sans MS", 14, QFont.Weight.Bold)
+        leaderboard_subtitle.setFont(font)
+        leaderboard_subtitle.setTextColor("white")
+
+        self.leaderboard_label = OverlayLabel("Loading...")
+        font = QFont("Comic Sans MS", 12, QFont.Weight.Light)
+        self.leaderboard_label.setFont(font)
+        self.leaderboard_label.setTextColor("white")
+        self.leaderboard_label.setWordWrap(True)
+        self.leaderboard_label.setMinimumHeight(300)
+        if getattr(self.parent, 'leaderboard', None) is not None:
+            self.parent.leaderboard.updated.connect(self.update_leaderboard)
+        if getattr(self.parent, 'sync', None) is not None:
+            self.parent.sync.synced.connect(lambda uid: self.update_user_data())
+
         # Email Section
         email_subtitle = OverlayLabel("Email")
         font = QFont("Comic Sans MS", 14, QFont.Weight.Bold)
@@ -149,6 +167,9 @@ class UserPage(QWidget):
         central_layout.addWidget(highscores_subtitle, alignment=Qt.AlignmentFlag.AlignHCenter)
         central_layout.addWidget(self.scores_label, alignment=Qt.AlignmentFlag.AlignLeft)
         central_layout.addSpacerItem(QSpacerItem(0, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Fixed))
+        central_layout.addWidget(leaderboard_subtitle, alignment=Qt.AlignmentFlag.AlignHCenter)
+        central_layout.addWidget(self.leaderboard_label, alignment=Qt.AlignmentFlag.AlignLeft)
+        central_layout.addSpacerItem(QSpacerItem(0, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Fixed))
         central_layout.addWidget(email_subtitle, alignment=Qt.AlignmentFlag.AlignLeft)
         central_layout.addLayout(email_layout)
         central_layout.addSpacerItem(QSpacerItem(0, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Fixed))
@@ -183,7 +204,11 @@ class UserPage(QWidget):
         if user:
             self.username_label.setText(user.get('displayName', user['email']))
             self.email_input.setText(user['email'])
-            scores = self.parent.fdb.get_user_records(user['localId'])
+            if getattr(self.parent, 'store', None) is not None:
+                # Last synced snapshot; refreshed when OfflineSync finishes
+                scores = {f"{mode}_mode_highscore": score for mode, score in self.parent.store.scores(user['localId']).items()}
+            else:
+                scores = self.parent.fdb.get_user_records(user['localId'])
             if scores:
                 scores_text = ""
                 for key, value in scores.items():
@@ -199,24 +224,42 @@ class UserPage(QWidget):
             self.username_label.setText("Not logged in")
             self.email_input.setText("Not logged in")
             self.scores_label.setText("Not logged in")
+        self.update_leaderboard()
+        if getattr(self.parent, 'leaderboard', None) is not None:
+            for mode in GAME_MODES:
+                self.parent.leaderboard.refresh(mode)
+
+    def update_leaderboard(self, *args):
+        """Show the top 3 of every mode from the cached boards"""
+        leaderboard = getattr(self.parent, 'leaderboard', None)
+        if leaderboard is None:
+            self.leaderboard_label.setText("Leaderboard unavailable.")
+            return
+        sections = []
+        for mode in GAME_MODES:
+            title = mode.replace("_", " ").title()
+            sections.append(f"{title}:\n{leaderboard.format(mode, limit=3)}")
+        self.leaderboard_label.setText("\n\n".join(sections))
 
     def change_email(self):
         new_email, ok = QInputDialog.getText(self, "Change Email", "Enter new email:", QLineEdit.EchoMode.Normal)
         if ok and new_email:
             user = self.parent.get_current_user()
-            if user and 'idToken' in user:
+            id_token = self.parent.valid_id_token() if user else None
+            if id_token:
                 # First check if current email is already verified
-                is_verified = self.parent.fdb.check_email_verification_status(user['idToken'])
+                is_verified = self.parent.fdb.check_email_verification_status(id_token)
                 
                 if is_verified:
                     # Email is verified, try to update directly
-                    result = self.parent.fdb.update_user_email(user['idToken'], new_email)
+                    result = self.parent.fdb.update_user_email(id_token, new_email)
                     if result:
                         user['email'] = new_email
                         if 'idToken' in result:
                             user['idToken'] = result['idToken']
                         if 'refreshToken' in result:
                             user['refreshToken'] = result['refreshToken']
+                        self.parent.set_current_user(user)  # Keeps the saved session and TokenManager current
                         
                         self.email_input.setText(new_email)
                         show_notification("Success", "Email updated successfully.")
@@ -224,7 +267,7 @@ class UserPage(QWidget):
                         show_notification("Error", "Failed to update email.")
                 else:
                     # Email not verified, need to send verification
-                    verification_result = self.parent.fdb.send_email_verification(user['idToken'])
+                    verification_result = self.parent.fdb.send_email_verification(id_token)
                     
                     if verification_result == True:
                         show_notification("Verification Required", 
@@ -258,8 +301,8 @@ class UserPage(QWidget):
                         if 'refreshToken' in result:
                             user['refreshToken'] = result['refreshToken']
                         
-                        # Save updated user data
-                        # self.parent.save_current_user(user)
+                        # Save updated user data; the old refresh token no longer works
+                        self.parent.set_current_user(user)
                         
                         show_notification("Success", "Password updated successfully.")
                     else:
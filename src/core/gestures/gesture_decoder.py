@@ -5,14 +5,8 @@ from src.core.gestures.methods.finger_count import FingerCount
 class GestureDecoder():
     def __init__(self):
         super().__init__()
+        # Only needs the landmark enum; hand tracking runs in the camera's Hands graph
         self.mp_hands = mp.solutions.hands
-        self.hands = self.mp_hands.Hands(
-            static_image_mode=False,
-            max_num_hands=2,
-            min_detection_confidence=0.5,
-            min_tracking_confidence=0.5
-        )
-        self.mp_drawing = mp.solutions.drawing_utils
         
     def detect_gestures(self, landmarks):
         landmarks_dictionary = get_hand_landmarks(landmarks, self.mp_hands)
@@ -1,15 +1,19 @@
-from pathlib import Path
-import sys
+from functools import lru_cache
+
+from src.core.logic.asset_manifest import get_manifest, get_assets_root
 
 def get_resource_path(relative_path: str) -> str:
-    if getattr(sys, 'frozen', False):
-        base_path = Path(sys._MEIPASS)
-    else:
-        base_path = Path(__file__).parent.parent
-        base_path = base_path.parent.parent  # Go up to the root of the project
-    path = base_path / 'assets' / relative_path
+    path = get_manifest().lookup(relative_path)
+    if path is not None:
+        return path
+    return _resolve_unlisted_resource(relative_path)
+
+@lru_cache(maxsize=None)
+def _resolve_unlisted_resource(relative_path: str) -> str:
+    # Only reached for names missing from the manifest; warn once per name
+    path = get_assets_root() / relative_path
     if not path.exists():
         print (path)
         print(f"Warning: Resource {relative_path} not found.")
-        return str(base_path / "img/default.png")
-    return str(path)
\ No newline at end of file
+        return str(get_assets_root().parent / "img/default.png")
+    return str(path)
@@ -0,0 +1,283 @@
+import json
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, QSize, QPoint, Qt, pyqtSignal
+from PyQt6.QtGui import QImage, QImageReader, QPixmap
+
+from src.core.logic.abstract_functions import get_resource_path
+from src.core.logic.asset_manifest import get_manifest
+
+IMAGE_SUFFIXES = (".png", ".jpg", ".jpeg")
+
+# Assets that are only ever shown small are decoded straight to a bounded size
+MAX_DECODE_SIZES = {
+    "img/menu/": QSize(400, 400),
+}
+
+class _DecodeTask(QRunnable):
+    """Decode one asset on a worker thread"""
+    def __init__(self, cache, name):
+        super().__init__()
+        self.cache = cache
+        self.name = name
+
+    def run(self):
+        self.cache._preload_one(self.name)
+        self.cache._task_done()
+
+class AssetCache(QObject):
+    """
+    Process-wide image cache
+
+    Scaled variants are handed out as QPixmaps keyed by name, size and scaling mode,
+    and evicted least-recently-used once they exceed the memory budget. A variant is
+    decoded straight to its size; only sources preloaded in the worker pool (within
+    max_source_bytes) are held at full size, and each is released as soon as a
+    variant has been built from it. Assets with pre-built sprites are never preloaded.
+    """
+    preload_finished = pyqtSignal()
+
+    _instance = None
+
+    def __init__(self, max_variant_bytes=192 * 1024 * 1024, max_source_bytes=64 * 1024 * 1024, parent=None):
+        super().__init__(parent)
+        self.max_variant_bytes = max_variant_bytes
+        self.max_source_bytes = max_source_bytes
+        self.images = {}  # name -> preloaded full-size QImage, until a variant is built from it
+        self.image_bytes = 0
+        self.used = set()  # names with variants built; a late preload must not bring them back
+        self.variants = OrderedDict()  # (name, width, height, aspect, transformation) -> QPixmap
+        self.variant_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.pending_tasks = 0
+        self.sprite_index = None  # pre-scaled sprite variants built by asset_pipeline
+        self.lock = threading.Lock()
+        self.pool = QThreadPool(self)
+
+    @classmethod
+    def instance(cls):
+        """Shared cache; created on first use, after the QApplication exists"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @staticmethod
+    def available_assets(folder="img"):
+        """Logical names (e.g. 'img/menu/3.png') of all raster images under an assets folder"""
+        assets_root = Path(get_resource_path("img")).parent
+        folder_path = assets_root / folder
+        if not folder_path.is_dir():
+            return []
+        return sorted(
+            path.relative_to(assets_root).as_posix()
+            for path in folder_path.rglob("*")
+            if path.suffix.lower() in IMAGE_SUFFIXES
+        )
+
+    def preload(self, names=None):
+        """Decode the given assets (default: all images without pre-built sprites) in the worker pool"""
+        names = [
+            name for name in (names or self.available_assets())
+            if name not in self.images and name not in self.used and not self.has_sprites(name)
+        ]
+        if not names:
+            self.preload_finished.emit()
+            return
+        with self.lock:
+            self.pending_tasks += len(names)
+        for name in names:
+            self.pool.start(_DecodeTask(self, name))
+
+    def wait_for_preload(self, msecs=-1):
+        """Block until queued decodes are done; returns False on timeout"""
+        return self.pool.waitForDone(msecs)
+
+    def _reader(self, name, size=None, aspect_mode=Qt.AspectRatioMode.IgnoreAspectRatio):
+        """QImageReader that decodes an asset straight to the size it is needed at"""
+        reader = QImageReader(get_resource_path(name))
+        reader.setAutoTransform(True)
+        full_size = reader.size()
+        if not full_size.isValid():
+            return reader
+        target = full_size
+        for prefix, max_size in MAX_DECODE_SIZES.items():
+            if name.startswith(prefix):
+                if full_size.width() > max_size.width() or full_size.height() > max_size.height():
+                    target = full_size.scaled(max_size, Qt.AspectRatioMode.KeepAspectRatio)
+                break
+        if size is not None and not size.isEmpty():
+            target = size if aspect_mode == Qt.AspectRatioMode.IgnoreAspectRatio else full_size.scaled(size, aspect_mode)
+        if target != full_size:
+            reader.setScaledSize(target)
+        return reader
+
+    def _read(self, name, size=None, aspect_mode=Qt.AspectRatioMode.IgnoreAspectRatio):
+        reader = self._reader(name, size, aspect_mode)
+        image = reader.read()
+        if image.isNull():
+            print(f"Warning: Failed to decode {name}: {reader.errorString()}")
+        return image
+
+    def _preload_one(self, name):
+        """Decode a source at full size if it fits the budget; runs in the worker pool"""
+        reader = self._reader(name)
+        size = reader.scaledSize() if reader.scaledSize().isValid() else reader.size()
+        estimate = size.width() * size.height() * 4
+        with self.lock:
+            if name in self.images or name in self.used or self.image_bytes + estimate > self.max_source_bytes:
+                return  # Decoded on first use instead, straight to the size it is shown at
+            self.image_bytes += estimate  # Reserved while decoding
+        image = reader.read()
+        with self.lock:
+            self.image_bytes -= estimate
+            if image.isNull():
+                print(f"Warning: Failed to decode {name}: {reader.errorString()}")
+            elif name not in self.images and name not in self.used:
+                self.images[name] = image
+                self.image_bytes += image.sizeInBytes()
+
+    def _task_done(self):
+        with self.lock:
+            self.pending_tasks -= 1
+            finished = self.pending_tasks == 0
+        if finished:
+            self.preload_finished.emit()
+
+    def image(self, name):
+        """Full-size decoded image of an asset; not kept, use pixmap() for anything shown"""
+        with self.lock:
+            image = self.images.get(name)
+        return image if image is not None else self._read(name)
+
+    def release(self, names):
+        """Drop preloaded sources, e.g. once a scene holds the variants it needs"""
+        with self.lock:
+            for name in names:
+                self.used.add(name)
+                image = self.images.pop(name, None)
+                if image is not None:
+                    self.image_bytes -= image.sizeInBytes()
+
+    def source_bytes(self, names):
+        """Memory held by the preloaded sources of the given assets"""
+        with self.lock:
+            return sum(self.images[name].sizeInBytes() for name in names if name in self.images)
+
+    def pixmap(self, name, size=None,
+               aspect_mode=Qt.AspectRatioMode.IgnoreAspectRatio,
+               transformation=Qt.TransformationMode.SmoothTransformation):
+        """
+        Pixmap of an asset, optionally scaled
+
+        Args:
+            name: Logical asset name relative to the assets folder, e.g. 'img/lobby.jpg'
+            size: Optional target QSize; None returns the image at its original size
+            aspect_mode: How to fit the image into size
+            transformation: Scaling quality
+        """
+        size = size if size is not None else QSize()
+        key = (name, size.width(), size.height(), aspect_mode.value, transformation.value)
+        pixmap = self.variants.get(key)
+        if pixmap is not None:
+            self.hits += 1
+            self.variants.move_to_end(key)
+            return pixmap
+
+        self.misses += 1
+        with self.lock:
+            source = self.images.get(name)
+        if source is not None:
+            image = source if size.isEmpty() else source.scaled(size, aspect_mode, transformation)
+            self.release([name])
+        else:
+            self.release([name])
+            image = self._read(name, size, aspect_mode)
+        pixmap = QPixmap.fromImage(image)
+        self._store_variant(key, pixmap)
+        return pixmap
+
+    def sprite(self, name, target):
+        """
+        Sprite fitted into target (keeping aspect ratio), trimmed when a pre-built variant exists
+
+        Returns:
+            (pixmap, offset, full_size): the pixmap to draw, where it sits inside the
+            untrimmed sprite, and the size of the untrimmed sprite
+        """
+        variant = self._sprite_variant(name, target)
+        if variant is None:
+            pixmap = self.pixmap(name, target, Qt.AspectRatioMode.KeepAspectRatio)
+            return pixmap, QPoint(0, 0), pixmap.size()
+
+        key = ("sprite", variant["file"])
+        pixmap = self.variants.get(key)
+        if pixmap is not None:
+            self.hits += 1
+            self.variants.move_to_end(key)
+        else:
+            self.misses += 1
+            image = QImageReader(get_manifest().lookup(variant["file"])).read()
+            # PNGs store straight alpha; convert once here so blits need no conversion
+            pixmap = QPixmap.fromImage(image.convertToFormat(QImage.Format.Format_ARGB32_Premultiplied))
+            self._store_variant(key, pixmap)
+        return pixmap, QPoint(*variant["offset"]), QSize(*variant["full_size"])
+
+    def _sprites(self, name):
+        if self.sprite_index is None:
+            index_path = get_manifest().lookup("sprites/sprites.json")
+            sprite_index = {}
+            if index_path:
+                with open(index_path, "r", encoding="utf-8") as file:
+                    sprite_index = json.load(file)
+            self.sprite_index = sprite_index
+        return self.sprite_index.get(name, [])
+
+    def has_sprites(self, name):
+        """Whether pre-built sprites exist for an asset; its source is then rarely needed"""
+        return any(get_manifest().lookup(variant["file"]) for variant in self._sprites(name))
+
+    def _sprite_variant(self, name, target):
+        for variant in self._sprites(name):
+            if variant["target"] == [target.width(), target.height()] and get_manifest().lookup(variant["file"]):
+                return variant
+        return None
+
+    def _store_variant(self, key, pixmap):
+        self.variants[key] = pixmap
+        self.variant_bytes += self.pixmap_bytes(pixmap)
+        while self.variant_bytes > self.max_variant_bytes and len(self.variants) > 1:
+            _, evicted = self.variants.popitem(last=False)
+            self.variant_bytes -= self.pixmap_bytes(evicted)
+
+    @staticmethod
+    def pixmap_bytes(pixmap):
+        return pixmap.width() * pixmap.height() * pixmap.depth() // 8
+
+    def clear_variants(self):
+        """Drop all scaled variants; decoded images are kept"""
+        self.variants.clear()
+        self.variant_bytes = 0
+
+    def stats(self):
+        """Hit/miss counters and resident memory of the cache"""
+        with self.lock:
+            decoded_bytes = self.image_bytes
+            decoded_images = len(self.images)
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "decoded_images": decoded_images,
+            "decoded_bytes": decoded_bytes,
+            "variants": len(self.variants),
+            "variant_bytes": self.variant_bytes,
+        }
+
+    def report(self):
+        """Print a one-line summary of cache effectiveness and memory use"""
+        stats = self.stats()
+        print(f"AssetCache: {stats['hits']} hits, {stats['misses']} misses, "
+              f"{stats['decoded_images']} images ({stats['decoded_bytes'] / 2**20:.1f} MB decoded), "
+              f"{stats['variants']} variants ({stats['variant_bytes'] / 2**20:.1f} MB scaled)")
@@ -0,0 +1,127 @@
+import hashlib
+import json
+import sys
+from pathlib import Path
+
+MANIFEST_FILE = "asset_manifest.json"
+
+# Assets the game cannot run properly without; checked once at launch
+REQUIRED_ASSETS = [
+    "img/lobby.jpg",
+    "img/drivetrhu.jpg",
+    "img/drivethru_ablak.png",
+    "img/car2.png",
+    "img/kitchen.jpg",
+    "img/bubble.png",
+    "img/timer.jpg",
+    "img/gesture_label.jpg",
+    "img/arrow_right.png",
+    "img/user.svg",
+    "img/email.svg",
+    "img/password.svg",
+    "img/visible.svg",
+    "img/invisible.svg",
+    "img/menu",
+    "text/instructionsHU.txt",
+]
+
+def get_assets_root() -> Path:
+    """Folder holding the assets, inside the bundle for frozen (PyInstaller) builds"""
+    if getattr(sys, 'frozen', False):
+        return Path(sys._MEIPASS) / 'assets'
+    return Path(__file__).parent.parent.parent.parent / 'assets'
+
+class AssetManifest:
+    """
+    Logical asset names (e.g. 'img/lobby.jpg') mapped to absolute paths, sizes and content hashes
+
+    Built once by walking the assets folder, or loaded from the manifest baked into
+    frozen builds, so resolving an asset is a dict lookup instead of a filesystem stat.
+    """
+    def __init__(self, root, entries):
+        self.root = Path(root)
+        self.entries = entries  # name -> {"path", "size", "sha1"}; directories have no size/hash
+
+    @classmethod
+    def build(cls, root=None):
+        """Scan the assets folder and hash every file"""
+        root = Path(root) if root else get_assets_root()
+        entries = {}
+        if root.is_dir():
+            for path in sorted(root.rglob("*")):
+                name = path.relative_to(root).as_posix()
+                if name == MANIFEST_FILE:
+                    continue
+                if path.is_dir():
+                    entries[name] = {"path": str(path), "size": None, "sha1": None}
+                else:
+                    entries[name] = {
+                        "path": str(path),
+                        "size": path.stat().st_size,
+                        "sha1": hashlib.sha1(path.read_bytes()).hexdigest(),
+                    }
+        return cls(root, entries)
+
+    @classmethod
+    def load(cls, root=None):
+        """Load a baked manifest, resolving its relative paths against root; None if there is none"""
+        root = Path(root) if root else get_assets_root()
+        manifest_path = root / MANIFEST_FILE
+        if not manifest_path.exists():
+            return None
+        with open(manifest_path, "r", encoding="utf-8") as file:
+            baked = json.load(file)
+        entries = {
+            name: dict(entry, path=str(root / name))
+            for name, entry in baked.items()
+        }
+        return cls(root, entries)
+
+    def write(self, manifest_path=None):
+        """Bake the manifest with paths relative to the assets folder (for packaging)"""
+        manifest_path = Path(manifest_path) if manifest_path else self.root / MANIFEST_FILE
+        baked = {
+            name: {"size": entry["size"], "sha1": entry["sha1"]}
+            for name, entry in self.entries.items()
+        }
+        with open(manifest_path, "w", encoding="utf-8") as file:
+            json.dump(baked, file, indent=2, sort_keys=True)
+        return manifest_path
+
+    def lookup(self, name):
+        """Absolute path of an asset, or None if it is not part of the manifest"""
+        entry = self.entries.get(name.strip("/"))
+        return entry["path"] if entry else None
+
+    def content_hash(self, name):
+        entry = self.entries.get(name.strip("/"))
+        return entry["sha1"] if entry else None
+
+    def missing(self, names):
+        return [name for name in names if name.strip("/") not in self.entries]
+
+_manifest = None
+
+def get_manifest():
+    """Process-wide manifest; baked one for frozen builds, otherwise scanned on first use"""
+    global _manifest
+    if _manifest is None:
+        if getattr(sys, 'frozen', False):
+            _manifest = AssetManifest.load()
+        if _manifest is None:
+            _manifest = AssetManifest.build()
+    return _manifest
+
+def verify_required_assets():
+    """Report every missing required asset in one go; returns the missing names"""
+    missing = get_manifest().missing(REQUIRED_ASSETS)
+    if missing:
+        print(f"Warning: {len(missing)} required asset(s) missing from {get_manifest().root}:")
+        for name in missing:
+            print(f"  - {name}")
+    return missing
+
+if __name__ == "__main__":
+    # Bake the manifest before packaging: python -m src.core.logic.asset_manifest
+    manifest = AssetManifest.build()
+    print(f"Wrote {len(manifest.entries)} entries to {manifest.write()}")
@@ -0,0 +1,137 @@
+"""
+Build-time sprite preprocessing
+
+Run before packaging (python -m src.core.logic.asset_pipeline). For every common
+screen resolution it scales the large drive-thru sprites to exactly the size the
+scene asks for, trims the transparent border (and, for static sprites, anything
+off screen), converts to premultiplied ARGB and records where the trimmed image
+sits inside the full sprite. The scenes load these through AssetCache.sprite() and
+fall back to scaling the source image at runtime when no variant was built.
+"""
+import json
+import sys
+
+from PyQt6.QtCore import QSize, Qt, QRect, QPoint
+from PyQt6.QtGui import QImage
+
+from src.core.logic.asset_manifest import get_assets_root
+
+SPRITES_DIR = "sprites"
+SPRITES_INDEX = "sprites.json"
+
+# Screen sizes we ship pre-scaled sprites for; larger ones share the capped render size
+RESOLUTION_BUCKETS = [
+    (1280, 960),
+    (1920, 1080),
+    (2560, 1440),
+    (3840, 2160),
+]
+
+def scene_size(screen_width, screen_height):
+    """Size of the game scenes on a screen; scenes never go below 1280x960"""
+    return max(screen_width, 1280), max(screen_height, 960)
+
+# Scenes are drawn at most at this size and scaled up when blitted to larger screens
+MAX_RENDER_SIZE = QSize(1920, 1080)
+
+def render_size(scene_width, scene_height):
+    """Internal resolution a scene is drawn at, so 4K screens don't need 4K pixmaps"""
+    size = QSize(scene_width, scene_height)
+    if size.width() > MAX_RENDER_SIZE.width() or size.height() > MAX_RENDER_SIZE.height():
+        size = size.scaled(MAX_RENDER_SIZE, Qt.AspectRatioMode.KeepAspectRatio)
+    return size.width(), size.height()
+
+def car_target_size(order_width, order_height):
+    """Box the car is scaled into, relative to the drive-thru order window"""
+    return QSize(
+        int(order_width * 2.644),  # 264.4% of width (1600/605)
+        int(order_height * 2)  # 200% of height (800/400)
+    )
+
+def sprite_target_sizes(scene_width, scene_height):
+    """Box each sprite is scaled into (keeping aspect ratio) for a scene of the given size"""
+    return {
+        "img/car2.png": car_target_size(int(scene_width * 0.406), int(scene_height * 0.416)),
+        "img/drivethru_ablak.png": QSize(
+            int(scene_width * 0.304 * 3.25),
+            int(scene_height * 0.717 * 3.25)
+        ),
+    }
+
+def foreground_origin(scene_width, scene_height, scaled_size):
+    """Top-left of the drive-thru window foreground, vertically centred in its box"""
+    box_height = int(scene_height * 0.717 * 3.25)
+    return QPoint(
+        -int(scene_width * 0.02),
+        -int(scene_height * 0.7) + (box_height - scaled_size.height()) // 2
+    )
+
+# Static sprites are also clipped to the part that is on screen; moving ones are not
+SPRITE_ORIGINS = {
+    "img/drivethru_ablak.png": foreground_origin,
+}
+
+def opaque_bounds(image):
+    """Smallest rectangle containing every pixel with non-zero alpha"""
+    import numpy as np
+
+    image = image.convertToFormat(QImage.Format.Format_ARGB32)
+    bits = image.constBits()
+    bits.setsize(image.sizeInBytes())
+    pixels = np.frombuffer(bits, np.uint8).reshape(image.height(), image.bytesPerLine())
+    alpha = pixels[:, 3:image.width() * 4:4]  # ARGB32 is stored as BGRA in memory
+    rows = np.flatnonzero(alpha.any(axis=1))
+    columns = np.flatnonzero(alpha.any(axis=0))
+    if rows.size == 0:
+        return QRect(0, 0, 1, 1)
+    return QRect(int(columns[0]), int(rows[0]), int(columns[-1] - columns[0] + 1), int(rows[-1] - rows[0] + 1))
+
+def build_sprites(buckets=RESOLUTION_BUCKETS):
+    """Write trimmed, pre-scaled sprites and their index under assets/sprites"""
+    assets_root = get_assets_root()
+    output_dir = assets_root / SPRITES_DIR
+    output_dir.mkdir(exist_ok=True)
+    index = {}
+    built = set()
+
+    for screen_width, screen_height in buckets:
+        scene_width, scene_height = render_size(*scene_size(screen_width, screen_height))
+        for name, target in sprite_target_sizes(scene_width, scene_height).items():
+            if (name, target.width(), target.height()) in built:
+                continue
+            built.add((name, target.width(), target.height()))
+            source = QImage(str(assets_root / name))
+            if source.isNull():
+                print(f"Warning: Cannot read {name}, skipping")
+                continue
+            scaled = source.scaled(target, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+            bounds = opaque_bounds(scaled)
+            if name in SPRITE_ORIGINS:
+                origin = SPRITE_ORIGINS[name](scene_width, scene_height, scaled.size())
+                bounds = bounds.intersected(QRect(-origin.x(), -origin.y(), scene_width, scene_height))
+            trimmed = scaled.copy(bounds).convertToFormat(QImage.Format.Format_ARGB32_Premultiplied)
+
+            stem = name.rsplit("/", 1)[-1].rsplit(".", 1)[0]
+            file_name = f"{stem}_{target.width()}x{target.height()}.png"
+            trimmed.save(str(output_dir / file_name))
+
+            index.setdefault(name, []).append({
+                "target": [target.width(), target.height()],
+                "file": f"{SPRITES_DIR}/{file_name}",
+                "full_size": [scaled.width(), scaled.height()],
+                "offset": [bounds.x(), bounds.y()],
+                "size": [bounds.width(), bounds.height()],
+            })
+            saved = 100 - 100 * bounds.width() * bounds.height() / (scaled.width() * scaled.height())
+            print(f"{name} @ {screen_width}x{screen_height}: {scaled.width()}x{scaled.height()} -> "
+                  f"{bounds.width()}x{bounds.height()} ({saved:.0f}% padding and off-screen area trimmed)")
+
+    index_path = output_dir / SPRITES_INDEX
+    with open(index_path, "w", encoding="utf-8") as file:
+        json.dump(index, file, indent=2, sort_keys=True)
+    return index_path
+
+if __name__ == "__main__":
+    from PyQt6.QtGui import QGuiApplication
+    app = QGuiApplication(sys.argv)  # Image format plugins need an application instance
+    print(f"Wrote sprite index to {build_sprites()}")
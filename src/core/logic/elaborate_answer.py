@@ -102,8 +102,8 @@ class ElaborateAnswer(QWidget):
             self.true_code = self.binary_array_to_decimal(self.true_code)
         
         if self.true_code == self.current_code:
-            if self._parent_test and hasattr(self._parent_test, 'update_timer'):
-                self._parent_test.update_timer.stop()
+            if self._parent_test and hasattr(self._parent_test, 'clock'):
+                self._parent_test.clock.pause()
             if hasattr(self._parent_test, 'reset_timer'):
                 self._parent_test.reset_timer()
             if self._parent_test and hasattr(self._parent_test, 'correct_answers_count'):
@@ -193,9 +193,14 @@ class ElaborateAnswer(QWidget):
                 print("Calling parent's update_score_display method via explicit reference")
                 self._parent_test.reset_score_display()
     
+    def reset(self):
+        """Hide the answer overlays, e.g. when a new round starts"""
+        self.correct_answer_overlay.hide()
+        self.incorrect_answer_overlay.hide()
+        self.time_is_up_overlay.hide()
+        self.hide()
+
     def back_to_menu_fn(self):
-        from src.scenes.menu.menu_window import Menu
-        
         self.time_is_up_overlay.hide()
         self.incorrect_answer_overlay.hide()
         self.hide()
@@ -212,6 +217,5 @@ class ElaborateAnswer(QWidget):
                 print("Calling parent's toggle_scenes method via explicit reference")
                 if self._parent_test.current_scene == "kitchen":
                     self._parent_test.toggle_scenes()
-        self.menu = Menu()
-        self.menu.showFullScreen()
-        self._parent_test.close()
\ No newline at end of file
+            if hasattr(self._parent_test, 'back_to_menu'):
+                self._parent_test.back_to_menu()
\ No newline at end of file
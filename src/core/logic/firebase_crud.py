@@ -1,14 +1,18 @@
-from firebase_admin import db
 from typing import Dict, List, Optional, Any
 import pyrebase
 import os
 import json
-from firebase_admin import credentials, auth, db
+from firebase_admin import credentials, auth
 from dotenv import load_dotenv
 from src.components.notification import show_notification
+from src.core.logic.storage import AdminStorage
+from src.core.logic.token_manager import TokenManager
+
+class _ScoreNotHigher(Exception):
+    pass
 
 class FirebaseCRUD:
-    def __init__(self):
+    def __init__(self, http=None, storage=None):
         load_dotenv()
         self.cred_path = os.getenv('FIREBASE_CREDENTIALS_PATH')
         self.db_url = os.getenv('FIREBASE_DATABASE_URL')
@@ -21,11 +25,15 @@ class FirebaseCRUD:
             "FIREBASE_MESSAGING_SENDER_ID": os.getenv('MESSAGING_SENDER_ID'),
             "FIREBASE_APP_ID": os.getenv('APP_ID')
         }
+        if storage is not None and not isinstance(storage, AdminStorage):
+            # Local backends need no service account or database
+            del required_vars["FIREBASE_CREDENTIALS_PATH"], required_vars["FIREBASE_DATABASE_URL"]
         missing_vars = [key for key, value in required_vars.items() if not value]
         if missing_vars:
             raise ValueError(f"Missing environment variables: {', '.join(missing_vars)}")
 
-        self.ref = db.reference("/users")
+        # Every database read and write goes through this Storage backend
+        self.storage = storage if storage is not None else AdminStorage()
         
         self.client_config = {
             "apiKey": os.getenv('FIREBASE_API_KEY'),
@@ -36,8 +44,21 @@ class FirebaseCRUD:
             "appId": os.getenv('APP_ID'),
         }
         
+        # Shared session so REST calls reuse connections
+        if http is None:
+            from src.core.logic.http_client import create_session
+            http = create_session()
+        self.http = http
+
         self.firebase_client = pyrebase.initialize_app(self.client_config)
         self.client_auth = self.firebase_client.auth()
+        # pyrebase builds its own session; hand it ours so sign-in and token refresh
+        # use the same pooled connections, timeouts and retry policy
+        self.firebase_client.requests = http
+        self.client_auth.requests = http
+
+        # Cached ID token of the signed-in player, refreshed before it expires
+        self.tokens = TokenManager(self)
 
     def create_user(self, username, email, password):
         try:
@@ -46,8 +67,7 @@ class FirebaseCRUD:
                 password=password,
                 display_name=username
             )
-            user_ref = db.reference(f'users/{user.uid}')
-            user_ref.set({
+            self.storage.set(f'users/{user.uid}', {
                 'username': username,
                 'email': email,
                 'default_mode_highscore': 0,
@@ -124,7 +144,7 @@ class FirebaseCRUD:
             return None
     def search_by_username(self, username):
         try:
-            users = self.ref.order_by_child("username").equal_to(username).get()
+            users = self.storage.query('users', order_by="username", equal_to=username)
             return users
         except Exception as e:
             return None
@@ -138,7 +158,6 @@ class FirebaseCRUD:
         
     def send_email_verification(self, id_token):
         """Send email verification to current user"""
-        import requests
         api_key = self.client_config['apiKey']
         url = f"https://identitytoolkit.googleapis.com/v1/accounts:sendOobCode?key={api_key}"
         payload = {
@@ -147,7 +166,7 @@ class FirebaseCRUD:
         }
         
         try:
-            response = requests.post(url, json=payload)
+            response = self.http.post(url, json=payload)
             result = response.json()
             
             if response.status_code == 200:
@@ -162,36 +181,81 @@ class FirebaseCRUD:
     def get_user_highscore_by_mode(self, uid, game_mode):
         """Get specific highscore for a user and game mode"""
         try:
-            user_ref = db.reference(f'users/{uid}')
-            user_data = user_ref.get()
-            if user_data:
-                highscore_key = f'{game_mode}_mode_highscore'
-                return user_data.get(highscore_key, 0)
-            return 0
+            return self.storage.get(f'users/{uid}/{game_mode}_mode_highscore') or 0
         except Exception as e:
             print(f"Error getting user highscore: {e}")
             return 0
 
-    def update_highscore(self, uid, game_mode, score, email):
+    def _keep_max(self, path, score):
+        """
+        Transaction raising the number stored at path to score
+
+        Returns:
+            (value, written): the value stored afterwards and whether score was written
+        """
+        stored = [score]
+
+        def keep_max(current):
+            if current is not None and current >= score:
+                stored[0] = current
+                raise _ScoreNotHigher()  # Aborts the transaction without writing
+            return score
+
+        try:
+            self.storage.transaction(path, keep_max)
+            return score, True
+        except _ScoreNotHigher:
+            return stored[0], False
+
+    def update_highscore(self, uid, game_mode, score, email=None):
+        """
+        Raise a highscore to score if it beats the stored one; returns False if the request failed
+
+        Runs as a transaction on just the users/{uid}/{mode}_mode_highscore leaf: no user
+        record is downloaded, and a concurrent higher score is never overwritten. The
+        best score is mirrored to leaderboards/{mode}/{uid} the same way.
+        """
         try:
-            user = auth.get_user_by_email(email)
-            user_ref = db.reference(f'users/{user.uid}')
-            current_data = user_ref.get()
-            current_score = current_data.get(f'{game_mode}_highscore', 0)
-            if score > current_score:
-                user_ref.update({f'{game_mode}_mode_highscore': score})
+            best, written = self._keep_max(f'users/{uid}/{game_mode}_mode_highscore', score)
+            if written:
                 print(f"Updated {game_mode} highscore for user {uid}: {score}")
+            # Also backfills players whose highscore predates the leaderboard
+            self._keep_max(f'leaderboards/{game_mode}/{uid}', best)
+            return True
         except Exception as e:
             print(f"Error updating highscore: {e}")
+            return False
+
+    def get_leaderboard(self, game_mode, limit=10):
+        """
+        Best scores of a game mode as [(uid, score)], highest first; None if the request failed
+
+        Needs ".indexOn": ".value" on /leaderboards/$mode in the database rules so the
+        server sorts and trims instead of sending the whole node.
+        """
+        try:
+            result = self.storage.query(f'leaderboards/{game_mode}', order_by="value", limit_to_last=limit)
+            if not result:
+                return []
+            return sorted(result.items(), key=lambda item: item[1], reverse=True)
+        except Exception as e:
+            print(f"Error getting {game_mode} leaderboard: {e}")
+            return None
+
+    def get_username(self, uid):
+        try:
+            return self.storage.get(f'users/{uid}/username')
+        except Exception as e:
+            print(f"Error getting username: {e}")
+            return None
 
     def update_user_email(self, id_token, new_email):
-        import requests
         api_key = self.client_config['apiKey']
         url = f"https://identitytoolkit.googleapis.com/v1/accounts:update?key={api_key}"
         payload = {"idToken": id_token, "email": new_email, "returnSecureToken": True}
         
         try:
-            response = requests.post(url, json=payload)
+            response = self.http.post(url, json=payload)
             result = response.json()
             
             if response.status_code == 200:
@@ -205,13 +269,12 @@ class FirebaseCRUD:
             return None
 
     def update_user_password(self, id_token, new_password):
-        import requests
         api_key = self.client_config['apiKey']
         url = f"https://identitytoolkit.googleapis.com/v1/accounts:update?key={api_key}"
         payload = {"idToken": id_token, "password": new_password, "returnSecureToken": True}
         
         try:
-            response = requests.post(url, json=payload)
+            response = self.http.post(url, json=payload)
             result = response.json()
             
             if response.status_code == 200:
@@ -226,14 +289,12 @@ class FirebaseCRUD:
 
     def get_user_records(self, uid):
         try:
-            user_ref = db.reference(f'users/{uid}')
-            return user_ref.get()
+            return self.storage.get(f'users/{uid}')
         except Exception as e:
             print(f"Error getting user records: {e}")
             return None
         
     def refresh_id_token(self, refresh_token):
-        import requests
         api_key = self.client_config['apiKey']
         url = f"https://securetoken.googleapis.com/v1/token?key={api_key}"
         payload = {
@@ -242,7 +303,7 @@ class FirebaseCRUD:
         }
         
         try:
-            response = requests.post(url, json=payload)
+            response = self.http.post(url, json=payload)
             if response.status_code == 200:
                 result = response.json()
                 return {
@@ -255,27 +316,28 @@ class FirebaseCRUD:
         return None
     def ensure_valid_token(self, user_data, email=None, password=None):
         """
-        Ensures we have a valid token, refreshing if possible or requiring re-auth
+        Ensures we have a valid token, refreshing only if it is about to expire or requiring re-auth
         Returns: (valid_token, updated_user_data) or (None, None) if re-auth needed
         """
         if not user_data or 'idToken' not in user_data:
             return None, None
-        
-        # First, try to refresh the existing token
-        if 'refreshToken' in user_data:
-            refresh_result = self.refresh_user(user_data['refreshToken'])
-            
-            if refresh_result and refresh_result != "TOKEN_EXPIRED":
-                # Successfully refreshed
-                user_data['idToken'] = refresh_result['idToken']
-                user_data['refreshToken'] = refresh_result['refreshToken']
-                return refresh_result['idToken'], user_data
-            elif refresh_result == "TOKEN_EXPIRED":
-                print("Refresh token expired. Need to re-authenticate.")
-                # If we have email and password, try to re-authenticate
-                if email and password:
-                    reauth_result = self.reauthenticate_user(email, password)
-                    if reauth_result:
-                        return reauth_result['idToken'], reauth_result
-        
+
+        # The TokenManager holds the current tokens (seeded on sign-in, rotated by its
+        # refreshes); user_data only seeds it when it has none, and gets the result back
+        if self.tokens.refresh_token is None:
+            self.tokens.set_tokens(user_data['idToken'], user_data.get('refreshToken'))
+        token = self.tokens.valid_token()
+        if token:
+            user_data['idToken'] = token
+            user_data['refreshToken'] = self.tokens.refresh_token
+            return token, user_data
+        if self.tokens.rejected:
+            print("Refresh token expired. Need to re-authenticate.")
+            # If we have email and password, try to re-authenticate
+            if email and password:
+                reauth_result = self.reauthenticate_user(email, password)
+                if reauth_result:
+                    self.tokens.set_tokens(reauth_result['idToken'], reauth_result['refreshToken'])
+                    return reauth_result['idToken'], reauth_result
+
         return None, None
\ No newline at end of file
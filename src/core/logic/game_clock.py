@@ -0,0 +1,84 @@
+from PyQt6.QtCore import QObject, QTimer, QElapsedTimer, Qt
+
+class GameClock(QObject):
+    """
+    Single frame scheduler for the game scenes
+
+    Game time comes from a monotonic clock and does not advance while the clock is paused,
+    so countdowns need no bookkeeping around pauses and are unaffected by wall-clock jumps.
+    Subscribers are called once per tick with the elapsed game time in milliseconds,
+    in stage order: animation first, then order countdowns, then the HUD.
+    """
+    ANIMATION = 0
+    COUNTDOWN = 1
+    HUD = 2
+
+    FRAME_MS = 16  # ~60 FPS
+
+    def __init__(self, parent=None, interval=FRAME_MS):
+        super().__init__(parent)
+        self.subscribers = []
+        self.paused = True
+        self.elapsed_before_pause = 0
+        self.last_tick = 0
+
+        self.monotonic = QElapsedTimer()
+        self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.timer.setInterval(interval)
+        self.timer.timeout.connect(self.tick)
+
+    def subscribe(self, callback, stage=ANIMATION, widget=None):
+        """
+        Call callback(delta_ms) on every tick
+
+        Args:
+            callback: Function taking the milliseconds of game time since the previous tick
+            stage: ANIMATION, COUNTDOWN or HUD; decides the call order within a tick
+            widget: Optional widget; the callback is skipped while it is not visible
+        """
+        self.subscribers.append((stage, callback, widget))
+        self.subscribers.sort(key=lambda subscriber: subscriber[0])
+
+    def unsubscribe(self, callback):
+        """Stop calling a previously subscribed callback"""
+        self.subscribers = [subscriber for subscriber in self.subscribers if subscriber[1] != callback]
+
+    def start(self):
+        """Start or resume ticking"""
+        if not self.paused:
+            return
+        self.monotonic.start()
+        self.paused = False
+        self.timer.start()
+
+    def pause(self):
+        """Stop ticking and freeze game time"""
+        if self.paused:
+            return
+        self.elapsed_before_pause += self.monotonic.elapsed()
+        self.paused = True
+        self.timer.stop()
+
+    def resume(self):
+        """Continue ticking from the game time reached at pause"""
+        self.start()
+
+    def is_paused(self):
+        return self.paused
+
+    def now(self):
+        """Current game time in milliseconds, excluding paused periods"""
+        if self.paused:
+            return self.elapsed_before_pause
+        return self.elapsed_before_pause + self.monotonic.elapsed()
+
+    def tick(self):
+        """Advance all visible subsystems by the game time elapsed since the last tick"""
+        now = self.now()
+        delta = now - self.last_tick
+        self.last_tick = now
+        for _, callback, widget in list(self.subscribers):
+            if widget is not None and not widget.isVisible():
+                continue
+            callback(delta)
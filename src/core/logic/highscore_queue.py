@@ -0,0 +1,138 @@
+import threading
+import time
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+class HighscoreQueue(QObject):
+    """
+    Write-behind queue for highscore submissions
+
+    submit() only records the score and returns, so game over never waits on the
+    network. A worker thread writes the pending scores; several submissions for the
+    same user and mode are coalesced to the highest one, and failed writes are
+    retried with exponential backoff. confirmed is emitted (on the GUI thread) once
+    the server accepted a score.
+
+    With a LocalStore the queue is durable: submissions are kept in its outbox until
+    confirmed, reloaded on the next start, and never given up on. After max_attempts
+    failed is emitted once and retries continue every max_delay seconds.
+    """
+    confirmed = pyqtSignal(str, str, int)  # uid, game mode, score
+    failed = pyqtSignal(str, str, int)  # gave up after max_attempts
+
+    def __init__(self, fdb, store=None, max_attempts=6, base_delay=1.0, max_delay=60.0, parent=None):
+        super().__init__(parent)
+        self.fdb = fdb
+        self.store = store
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.pending = {}  # (uid, mode) -> {"score", "email", "attempts", "due"}
+        self.in_flight = set()
+        self.condition = threading.Condition()
+        if store is not None:
+            for uid, game_mode, score, email in store.pending_writes():
+                self.pending[(uid, game_mode)] = {"score": score, "email": email, "attempts": 0, "due": 0.0}
+        # Daemon thread, so an unreachable server cannot keep the game from quitting
+        self.worker = threading.Thread(target=self._run, name="HighscoreQueue", daemon=True)
+        self.worker.start()
+
+    def submit(self, uid, game_mode, score, email=None):
+        """Queue a score; returns immediately"""
+        if self.store is not None:
+            self.store.queue_write(uid, game_mode, score, email)
+        key = (uid, game_mode)
+        with self.condition:
+            entry = self.pending.get(key)
+            if entry is None:
+                self.pending[key] = {"score": score, "email": email, "attempts": 0, "due": 0.0}
+            elif score > entry["score"]:
+                entry["score"] = score
+                entry["email"] = email or entry["email"]
+            self.condition.notify()
+
+    def pending_count(self):
+        with self.condition:
+            return len(self.pending) + len(self.in_flight)
+
+    def flush(self, timeout=2.0):
+        """Wait up to timeout seconds for queued scores to be written; returns whether it drained"""
+        deadline = time.monotonic() + timeout
+        with self.condition:
+            for entry in self.pending.values():
+                entry["due"] = 0.0  # Skip any backoff still running
+            self.condition.notify()
+            while self.pending or self.in_flight:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    where = "kept in the local outbox" if self.store is not None else "not written before exit"
+                    print(f"Warning: {len(self.pending) + len(self.in_flight)} highscore(s) {where}")
+                    return False
+                self.condition.wait(remaining)
+        return True
+
+    def _next_due(self):
+        """Pop the pending entry whose retry time has come; otherwise seconds until the next one"""
+        now = time.monotonic()
+        for key, entry in self.pending.items():
+            if key not in self.in_flight and entry["due"] <= now:
+                del self.pending[key]
+                self.in_flight.add(key)
+                return key, entry, None
+        waits = [entry["due"] - now for key, entry in self.pending.items() if key not in self.in_flight]
+        return None, None, min(waits) if waits else None
+
+    def _run(self):
+        while True:
+            with self.condition:
+                key, entry, wait = self._next_due()
+                while key is None:
+                    self.condition.wait(wait)
+                    key, entry, wait = self._next_due()
+            try:
+                self._write(key, entry)
+            except Exception as e:
+                # Keep the worker alive; the score is retried like a failed write
+                print(f"Highscore queue error: {e}")
+                with self.condition:
+                    self.in_flight.discard(key)
+                    self._retry_later(key, entry)
+                    self.condition.notify_all()
+
+    def _write(self, key, entry):
+        uid, game_mode = key
+        try:
+            success = self.fdb.update_highscore(uid, game_mode, entry["score"], entry["email"])
+            if success and self.store is not None:
+                self.store.clear_write(uid, game_mode, entry["score"])
+        except Exception as e:
+            # e.g. a locked outbox; writing the same score again is harmless
+            print(f"Error writing {game_mode} highscore for {uid}: {e}")
+            success = False
+
+        with self.condition:
+            self.in_flight.discard(key)
+            if not success:
+                self._retry_later(key, entry)
+            self.condition.notify_all()
+        if success:
+            self.confirmed.emit(uid, game_mode, entry["score"])
+
+    def _retry_later(self, key, entry):
+        """Put a failed entry back with backoff; call with the condition held"""
+        uid, game_mode = key
+        entry["attempts"] += 1
+        if entry["attempts"] >= self.max_attempts and self.store is None:
+            print(f"Giving up on {game_mode} highscore {entry['score']} for {uid}")
+            self.failed.emit(uid, game_mode, entry["score"])
+            return
+        if entry["attempts"] == self.max_attempts:
+            print(f"{game_mode} highscore {entry['score']} for {uid} kept for later sync")
+            self.failed.emit(uid, game_mode, entry["score"])
+        delay = min(self.base_delay * 2 ** (entry["attempts"] - 1), self.max_delay)
+        entry["due"] = time.monotonic() + delay
+        queued = self.pending.get(key)
+        if queued is not None:
+            # A newer submission arrived meanwhile; keep the higher score
+            entry["score"] = max(entry["score"], queued["score"])
+        self.pending[key] = entry
@@ -0,0 +1,41 @@
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Seconds to connect and to wait for a response; requests has no default and waits forever
+HTTP_TIMEOUT = (3.05, 10)
+
+class _TimeoutSession(requests.Session):
+    def __init__(self, timeout):
+        super().__init__()
+        self.timeout = timeout
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault("timeout", self.timeout)
+        return super().request(method, url, **kwargs)
+
+def create_session(timeout=HTTP_TIMEOUT, pool_size=10, retries=3, backoff=0.3):
+    """
+    Keep-alive requests.Session shared by every REST call of the game
+
+    Connections to the identity toolkit and token endpoints are pooled, so only the
+    first call pays the TCP and TLS handshakes. Every request gets a timeout. Failed
+    connections are retried with backoff for all methods, since nothing was sent yet;
+    read errors and 5xx responses only for idempotent methods, because POSTs like
+    sendOobCode must not be repeated.
+    """
+    retry = Retry(
+        total=retries,
+        connect=retries,
+        read=retries,
+        status=retries,
+        backoff_factor=backoff,
+        status_forcelist=(500, 502, 503, 504),
+        allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session = _TimeoutSession(timeout)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
@@ -0,0 +1,150 @@
+import threading
+import time
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+GAME_MODES = ["default", "reverse", "double_trouble", "speedrun"]
+
+class Leaderboard(QObject):
+    """
+    Cached top-N boards read from /leaderboards/{mode}
+
+    A refresh is one order_by_value().limit_to_last(N) query on a worker thread, and
+    only when the cached board is older than max_age. Usernames are looked up once per
+    player. Scores confirmed by this cabinet are merged in locally, so they show up
+    without another query. While a mode is watched, the same limited query is followed
+    through the ListenerManager, so the board follows the database live without
+    downloading every player's score. updated(mode) is emitted on the GUI thread.
+    """
+    updated = pyqtSignal(str)
+
+    def __init__(self, fdb, listeners=None, size=10, max_age=60.0, parent=None):
+        super().__init__(parent)
+        self.fdb = fdb
+        self.listeners = listeners
+        self.watched = None  # (mode, listener id)
+        self.size = size
+        self.max_age = max_age
+        self.boards = {}  # mode -> {"rows": [(uid, score)], "fetched": monotonic time}
+        self.names = {}  # uid -> username
+        self.loading = set()
+        self.lock = threading.Lock()
+
+    def entries(self, game_mode, limit=None):
+        """Cached board as [(username, score)], best first; empty until the first refresh finishes"""
+        with self.lock:
+            board = self.boards.get(game_mode)
+            rows = list(board["rows"]) if board else []
+            return [(self.names.get(uid) or "Player", score) for uid, score in rows[:limit or self.size]]
+
+    def format(self, game_mode, limit=None):
+        """Board as display text, one '1. name  score' line per player"""
+        entries = self.entries(game_mode, limit)
+        if not entries:
+            return "No scores yet."
+        return "\n".join(f"{rank}. {name}  {score}" for rank, (name, score) in enumerate(entries, start=1))
+
+    def refresh(self, game_mode, force=False):
+        """Reload a board in the background unless the cached one is still fresh"""
+        with self.lock:
+            board = self.boards.get(game_mode)
+            fresh = board is not None and time.monotonic() - board["fetched"] < self.max_age
+            if (fresh and not force) or game_mode in self.loading:
+                return
+            self.loading.add(game_mode)
+        threading.Thread(target=self._load, args=(game_mode,), daemon=True).start()
+
+    def watch(self, game_mode):
+        """
+        Follow one board live, replacing the previously watched one
+
+        Returns at once: the listener is opened in the background. The cached board
+        is refreshed as well, so it still loads if the listener cannot be opened.
+        """
+        self.refresh(game_mode)
+        if self.listeners is None:
+            return
+        if self.watched is not None:
+            if self.watched[0] == game_mode:
+                return
+            self.unwatch()
+        listener_id = self.listeners.listen(
+            f'leaderboards/{game_mode}', lambda events: self._apply_events(game_mode, events),
+            order_by="value", limit_to_last=self.size
+        )
+        self.watched = (game_mode, listener_id)
+
+    def unwatch(self):
+        if self.watched is not None:
+            self.listeners.remove(self.watched[1])
+            self.watched = None
+
+    def _apply_events(self, game_mode, events):
+        """
+        Merge a batch of listener events (GUI thread) into the cached board
+
+        The stream is the top-N query: a player dropping out of it arrives as a None
+        value and the one moving up into it as a put of their own.
+        """
+        with self.lock:
+            board = self.boards.get(game_mode)
+            scores = dict(board["rows"]) if board else {}
+            for event_type, path, data in events:
+                if path == "/":
+                    if event_type == "put":
+                        scores = {}
+                    changes = (data or {}).items()
+                else:
+                    changes = [(path, data)]
+                for child, value in changes:
+                    uid = child.strip("/").split("/")[0]
+                    if value is None:
+                        scores.pop(uid, None)
+                    else:
+                        scores[uid] = value
+            rows = sorted(scores.items(), key=lambda item: item[1], reverse=True)[:self.size]
+            self.boards[game_mode] = {"rows": rows, "fetched": time.monotonic()}
+            unknown = [uid for uid, _ in rows if uid not in self.names]
+        if unknown:
+            threading.Thread(target=self._load_names, args=(game_mode, unknown), daemon=True).start()
+        self.updated.emit(game_mode)
+
+    def _load_names(self, game_mode, uids):
+        names = {uid: self.fdb.get_username(uid) for uid in uids}
+        with self.lock:
+            self.names.update(names)
+        self.updated.emit(game_mode)
+
+    def _load(self, game_mode):
+        rows = self.fdb.get_leaderboard(game_mode, self.size)
+        if rows is not None:
+            unknown = [uid for uid, _ in rows if uid not in self.names]
+            names = {uid: self.fdb.get_username(uid) for uid in unknown}
+        with self.lock:
+            self.loading.discard(game_mode)
+            if rows is None:
+                return  # Keep showing the cached board
+            self.names.update(names)
+            self.boards[game_mode] = {"rows": rows, "fetched": time.monotonic()}
+        self.updated.emit(game_mode)
+
+    def set_name(self, uid, name):
+        """Known username of a player, e.g. the one signed in; saves looking it up"""
+        if name:
+            with self.lock:
+                self.names[uid] = name
+
+    def record(self, uid, game_mode, score, name=None):
+        """Merge a confirmed score into the cached board"""
+        with self.lock:
+            if name:
+                self.names[uid] = name
+            board = self.boards.get(game_mode)
+            if board is None:
+                return  # Not loaded yet; the next refresh includes it
+            scores = dict(board["rows"])
+            if score <= scores.get(uid, -1):
+                return
+            scores[uid] = score
+            board["rows"] = sorted(scores.items(), key=lambda item: item[1], reverse=True)[:self.size]
+        self.updated.emit(game_mode)
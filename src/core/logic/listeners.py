@@ -0,0 +1,114 @@
+import itertools
+import threading
+
+from PyQt6.QtCore import QObject, Qt, QTimer, pyqtSignal
+
+class ListenerManager(QObject):
+    """
+    Realtime Database listeners whose callbacks run on the GUI thread
+
+    firebase_admin delivers events on its own SSE threads, where touching widgets is
+    unsafe. Events are queued here instead and handed to the callback in one batch per
+    frame (interval_ms), so a burst of updates costs one UI update. A put drops the
+    queued events it overwrites and consecutive patches on the same path are merged.
+    Streams are opened and closed on worker threads, since both are network requests
+    that must not stall the GUI. Listens through the FirebaseCRUD's Storage backend,
+    so local backends stream too.
+    """
+    _events_pending = pyqtSignal()
+
+    def __init__(self, storage, interval_ms=16, parent=None):
+        super().__init__(parent)
+        self.storage = storage
+        self.interval_ms = interval_ms
+        self.registrations = {}  # listener id -> [ListenerRegistration or None while opening, callback]
+        self.pending = {}  # listener id -> [(event_type, path, data)]
+        self.flush_scheduled = False
+        self.lock = threading.Lock()
+        self.ids = itertools.count(1)
+        self._events_pending.connect(self._schedule_flush, Qt.ConnectionType.QueuedConnection)
+
+    def listen(self, path, callback, **query):
+        """
+        Stream changes below path
+
+        Args:
+            path: Database path to listen to
+            callback: Called on the GUI thread with a list of (event_type, path, data)
+            query: Storage.query() arguments to stream only the matching children
+
+        Returns:
+            Listener id for remove()
+        """
+        listener_id = next(self.ids)
+        with self.lock:
+            self.registrations[listener_id] = [None, callback]
+        threading.Thread(target=self._open, args=(listener_id, path, query), daemon=True).start()
+        return listener_id
+
+    def _open(self, listener_id, path, query):
+        """Runs on a worker thread; opening the stream connects to the server"""
+        def on_event(event):  # Runs on the Firebase SSE thread
+            self._queue(listener_id, event.event_type, event.path, event.data)
+
+        try:
+            registration = self.storage.listen(path, on_event, **query)
+        except Exception as e:
+            print(f"Error listening to {path}: {e}")
+            with self.lock:
+                self.registrations.pop(listener_id, None)
+            return
+        with self.lock:
+            entry = self.registrations.get(listener_id)
+            if entry is not None:
+                entry[0] = registration
+                return
+        registration.close()  # Removed while it was opening
+
+    def remove(self, listener_id):
+        """Close a listener's stream and drop its queued events"""
+        with self.lock:
+            entry = self.registrations.pop(listener_id, None)
+            self.pending.pop(listener_id, None)
+        if entry is not None and entry[0] is not None:
+            # close() joins the SSE thread, which can take a while on a slow connection
+            threading.Thread(target=entry[0].close, daemon=True).start()
+
+    def close_all(self):
+        with self.lock:
+            listener_ids = list(self.registrations)
+        for listener_id in listener_ids:
+            self.remove(listener_id)
+
+    def _queue(self, listener_id, event_type, path, data):
+        with self.lock:
+            events = self.pending.setdefault(listener_id, [])
+            if event_type == "put":
+                # Overwrites everything queued at or below its path
+                prefix = path.rstrip("/") + "/"
+                events[:] = [event for event in events if event[1] != path and not event[1].startswith(prefix)]
+            if event_type == "patch" and events and events[-1][0] == "patch" and events[-1][1] == path:
+                events[-1][2].update(data)
+            else:
+                events.append((event_type, path, dict(data) if event_type == "patch" else data))
+            if self.flush_scheduled:
+                return
+            self.flush_scheduled = True
+        self._events_pending.emit()
+
+    def _schedule_flush(self):
+        QTimer.singleShot(self.interval_ms, self._flush)
+
+    def _flush(self):
+        with self.lock:
+            pending, self.pending = self.pending, {}
+            self.flush_scheduled = False
+        for listener_id, events in pending.items():
+            with self.lock:
+                entry = self.registrations.get(listener_id)
+            if entry is None:
+                continue  # Removed while its events were queued
+            try:
+                entry[1](events)
+            except Exception as e:
+                print(f"Error in listener {listener_id}: {e}")
@@ -0,0 +1,142 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from PyQt6.QtCore import QObject, QStandardPaths, pyqtSignal
+
+def default_path():
+    """local.db next to the game's other per-user data"""
+    base = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.GenericDataLocation)
+    return os.path.join(base, "Th1nkItThr0", "Dr1veThr0", "local.db")
+
+class LocalStore:
+    """
+    SQLite copy of the player data the game reads, plus the highscore outbox
+
+    Reads never touch the network, so they work without connectivity and take
+    microseconds. Scores only ever go up here, like on the server. Pending writes
+    survive a restart until the HighscoreQueue gets them confirmed. Safe to use from
+    several threads.
+    """
+    def __init__(self, path=None):
+        self.path = path or default_path()
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(self.path, check_same_thread=False)
+        with self.lock, self.connection:
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.executescript("""
+                CREATE TABLE IF NOT EXISTS scores (
+                    uid TEXT, game_mode TEXT, score INTEGER,
+                    PRIMARY KEY (uid, game_mode)
+                );
+                CREATE TABLE IF NOT EXISTS profiles (
+                    uid TEXT PRIMARY KEY, data TEXT, synced REAL
+                );
+                CREATE TABLE IF NOT EXISTS pending_writes (
+                    uid TEXT, game_mode TEXT, score INTEGER, email TEXT,
+                    PRIMARY KEY (uid, game_mode)
+                );
+            """)
+
+    def _execute(self, query, params=()):
+        with self.lock, self.connection:
+            return self.connection.execute(query, params).fetchall()
+
+    def record_score(self, uid, game_mode, score):
+        """Raise the local best score; returns the best score afterwards"""
+        self._execute(
+            "INSERT INTO scores VALUES (?, ?, ?) "
+            "ON CONFLICT (uid, game_mode) DO UPDATE SET score = MAX(score, excluded.score)",
+            (uid, game_mode, score)
+        )
+        return self.best_score(uid, game_mode)
+
+    def best_score(self, uid, game_mode):
+        rows = self._execute("SELECT score FROM scores WHERE uid = ? AND game_mode = ?", (uid, game_mode))
+        return rows[0][0] if rows else 0
+
+    def scores(self, uid):
+        """Best score per game mode"""
+        return dict(self._execute("SELECT game_mode, score FROM scores WHERE uid = ?", (uid,)))
+
+    def save_profile(self, uid, data):
+        """Store a /users/{uid} snapshot and merge its highscores into the local scores"""
+        self._execute(
+            "INSERT OR REPLACE INTO profiles VALUES (?, ?, ?)", (uid, json.dumps(data), time.time())
+        )
+        for key, value in data.items():
+            if key.endswith("_mode_highscore") and isinstance(value, int):
+                self.record_score(uid, key[:-len("_mode_highscore")], value)
+
+    def profile(self, uid):
+        """Last synced /users/{uid} snapshot, or None"""
+        rows = self._execute("SELECT data FROM profiles WHERE uid = ?", (uid,))
+        return json.loads(rows[0][0]) if rows else None
+
+    def queue_write(self, uid, game_mode, score, email=None):
+        self._execute(
+            "INSERT INTO pending_writes VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (uid, game_mode) DO UPDATE SET score = MAX(score, excluded.score), "
+            "email = COALESCE(excluded.email, email)",
+            (uid, game_mode, score, email)
+        )
+
+    def pending_writes(self):
+        """Outbox as [(uid, game_mode, score, email)]"""
+        return self._execute("SELECT uid, game_mode, score, email FROM pending_writes")
+
+    def clear_write(self, uid, game_mode, score):
+        """Drop a confirmed write, unless a higher score was queued meanwhile"""
+        self._execute(
+            "DELETE FROM pending_writes WHERE uid = ? AND game_mode = ? AND score <= ?",
+            (uid, game_mode, score)
+        )
+
+    def close(self):
+        with self.lock:
+            self.connection.close()
+
+class OfflineSync(QObject):
+    """
+    Reconciles the LocalStore with the database for the signed-in player
+
+    sync_user() fetches /users/{uid} on a worker thread and stores the snapshot.
+    Scores reached while offline that the server does not have yet are queued on
+    the HighscoreQueue, whose worker keeps retrying until connectivity returns.
+    synced(uid) is emitted on the GUI thread once the snapshot is stored.
+    """
+    synced = pyqtSignal(str)
+
+    def __init__(self, fdb, store, highscores, parent=None):
+        super().__init__(parent)
+        self.fdb = fdb
+        self.store = store
+        self.highscores = highscores
+        self.syncing = set()
+        self.lock = threading.Lock()
+
+    def sync_user(self, uid):
+        with self.lock:
+            if uid in self.syncing:
+                return
+            self.syncing.add(uid)
+        threading.Thread(target=self._sync, args=(uid,), daemon=True).start()
+
+    def _sync(self, uid):
+        try:
+            records = self.fdb.get_user_records(uid)
+            if records is None:
+                print("Offline, showing the locally stored profile")
+                return
+            self.store.save_profile(uid, records)
+            for game_mode, score in self.store.scores(uid).items():
+                if score > records.get(f'{game_mode}_mode_highscore', 0):
+                    self.highscores.submit(uid, game_mode, score, records.get('email'))
+            self.synced.emit(uid)
+        finally:
+            with self.lock:
+                self.syncing.discard(uid)
@@ -0,0 +1,173 @@
+from PyQt6.QtCore import QObject, QThread, pyqtSignal
+
+class PerceptionStack:
+    """
+    Camera and MediaPipe models used by the camera widget
+
+    cv2 and mediapipe are imported here, when the stack is built, so nothing on the
+    menu path pays for them. Building and warming up is slow, which is why the menu
+    does it on a PerceptionLoader thread before the game needs it.
+    """
+    def __init__(self, number_of_hands=1):
+        import mediapipe as mp
+        from src.core.gestures.gesture_decoder import GestureDecoder
+        from src.core.gestures.wink_detector import WinkDetector
+
+        self.number_of_hands = number_of_hands
+        self.capture = None
+        self.mp_hands = mp.solutions.hands
+        self.mp_drawing = mp.solutions.drawing_utils
+        self.hands = None
+        self.create_hands_detector()
+        self.wink_detector = WinkDetector()
+        self.gesture_decoder = GestureDecoder()
+
+    def create_hands_detector(self):
+        """Create (or recreate) the Hands graph for the current number of hands"""
+        if self.hands is not None:
+            self.hands.close()
+        self.hands = self.mp_hands.Hands(
+            static_image_mode=False,
+            max_num_hands=self.number_of_hands,
+            min_detection_confidence=0.5,
+            min_tracking_confidence=0.5
+        )
+
+    def set_number_of_hands(self, number_of_hands):
+        """Rebuild the Hands graph only if the number of hands actually changes"""
+        if number_of_hands != self.number_of_hands:
+            self.number_of_hands = number_of_hands
+            self.create_hands_detector()
+
+    def open_camera(self):
+        """Open the default camera if it is not open yet; returns whether it is open"""
+        import cv2
+        if self.capture is None:
+            self.capture = cv2.VideoCapture(0)
+        elif not self.capture.isOpened():
+            self.capture.open(0)
+        return self.capture.isOpened()
+
+    def warm_up(self, progress=None):
+        """
+        Open the camera and run one inference through every model
+
+        Args:
+            progress: Optional callback(percent, message) for each finished step
+        """
+        import numpy as np
+
+        def report(percent, message):
+            if progress:
+                progress(percent, message)
+
+        report(10, "Opening camera")
+        if self.open_camera():
+            ret, frame = self.capture.read()  # The first read is by far the slowest
+        else:
+            ret, frame = False, None
+        report(40, "Loading hand model")
+        if not ret:
+            frame = np.zeros((480, 640, 3), dtype=np.uint8)
+        self.hands.process(frame)
+        report(70, "Loading face model")
+        self.wink_detector.detect_wink(frame)
+        report(100, "Ready")
+
+    def close(self):
+        if self.hands is not None:
+            self.hands.close()
+            self.hands = None
+        self.wink_detector.release()
+        if self.capture is not None:
+            self.capture.release()
+            self.capture = None
+
+class _WarmupThread(QThread):
+    progress = pyqtSignal(int, str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.stack = None
+        self.error = None
+
+    def run(self):
+        try:
+            stack = PerceptionStack()
+            stack.warm_up(self.progress.emit)
+            self.stack = stack
+        except Exception as e:
+            self.error = str(e)
+
+class PerceptionLoader(QObject):
+    """
+    Builds and warms up the shared PerceptionStack in the background
+
+    Started when the menu is shown; the game scene picks up the ready stack instead of
+    opening the camera and loading models on the UI thread. The stack is kept for the
+    lifetime of the app and reused by every game.
+    """
+    progress = pyqtSignal(int, str)
+    ready = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+    _instance = None
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.stack = None
+        self.warmup_thread = None
+        self.percent = 0
+
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def is_ready(self):
+        return self.stack is not None
+
+    def start(self):
+        """Start warming up, unless the stack is ready or already being built"""
+        if self.stack is not None or self.warmup_thread is not None:
+            return
+        self.percent = 0
+        self.warmup_thread = _WarmupThread(self)
+        self.warmup_thread.progress.connect(self._on_progress)
+        self.warmup_thread.finished.connect(self._on_finished)
+        self.warmup_thread.start()
+
+    def _on_progress(self, percent, message):
+        self.percent = percent
+        self.progress.emit(percent, message)
+
+    def _on_finished(self):
+        if self.warmup_thread is None:
+            return  # Already collected by take()
+        thread, self.warmup_thread = self.warmup_thread, None
+        thread.wait()
+        if thread.stack is None:
+            print(f"Error warming up the perception stack: {thread.error}")
+            self.failed.emit(thread.error or "")
+            return
+        self.stack = thread.stack
+        print("Perception stack warmed up")
+        self.ready.emit(self.stack)
+
+    def take(self):
+        """The ready stack, waiting for warm-up or building one synchronously if needed"""
+        if self.warmup_thread is not None:
+            self._on_finished()
+        if self.stack is None:
+            self.stack = PerceptionStack()
+        return self.stack
+
+    def shutdown(self):
+        """Release the camera and models; called when the application quits"""
+        if self.warmup_thread is not None:
+            self.warmup_thread.wait()
+            self._on_finished()
+        if self.stack is not None:
+            self.stack.close()
+            self.stack = None
@@ -0,0 +1,35 @@
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QPixmap, QPixmapCache
+
+def load_pixmap(path: str) -> QPixmap:
+    """Load an image once and share the decoded pixmap between widgets"""
+    key = f"file:{path}"
+    pixmap = QPixmapCache.find(key)
+    if pixmap is None or pixmap.isNull():
+        pixmap = QPixmap(path)
+        if not pixmap.isNull():
+            QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+def scaled_pixmap(pixmap: QPixmap, size, source_key: str = None,
+                  aspect_mode=Qt.AspectRatioMode.KeepAspectRatio,
+                  transformation=Qt.TransformationMode.SmoothTransformation) -> QPixmap:
+    """
+    Return the pixmap scaled to size, reusing earlier scalings of the same source
+
+    Args:
+        pixmap: Source pixmap
+        size: Target QSize
+        source_key: Stable name of the source (e.g. its path), so widgets that load
+            the same image separately share one scaled copy
+    """
+    if pixmap.isNull() or size.isEmpty():
+        return pixmap
+    if source_key is None:
+        source_key = str(pixmap.cacheKey())
+    key = f"scaled:{source_key}:{size.width()}x{size.height()}:{aspect_mode.value}:{transformation.value}"
+    scaled = QPixmapCache.find(key)
+    if scaled is None or scaled.isNull():
+        scaled = pixmap.scaled(size, aspect_mode, transformation)
+        QPixmapCache.insert(key, scaled)
+    return scaled
@@ -0,0 +1,62 @@
+class Services:
+    """
+    Registry of the clients the game shares for its whole run
+
+    Created once in main() after Firebase is initialized and passed down to the
+    scenes, so the database and auth clients, the HTTP session and the perception
+    loader are built exactly once instead of by every window that needs them.
+    """
+    _instance = None
+
+    def __init__(self, fdb, http, perception, assets, store, highscores, sync, listeners, leaderboard):
+        self.fdb = fdb  # FirebaseCRUD: Admin SDK database access and the pyrebase auth client
+        self.auth = fdb.client_auth
+        self.http = http  # Pooled requests.Session for every REST call, pyrebase's included
+        self.perception = perception
+        self.assets = assets
+        self.store = store  # LocalStore: offline copy of scores and profiles, highscore outbox
+        self.highscores = highscores  # HighscoreQueue writing scores in the background
+        self.sync = sync  # OfflineSync reconciling the LocalStore with the database
+        self.listeners = listeners  # ListenerManager: realtime streams delivered on the GUI thread
+        self.leaderboard = leaderboard  # Cached top-N boards per game mode
+
+    @classmethod
+    def create(cls, storage=None):
+        """
+        Build every service; call once firebase_admin.initialize_app has run
+
+        Args:
+            storage: Storage backend for all database access, the Admin SDK by default
+        """
+        from src.core.logic.asset_cache import AssetCache
+        from src.core.logic.firebase_crud import FirebaseCRUD
+        from src.core.logic.highscore_queue import HighscoreQueue
+        from src.core.logic.http_client import create_session
+        from src.core.logic.leaderboard import Leaderboard
+        from src.core.logic.listeners import ListenerManager
+        from src.core.logic.local_store import LocalStore, OfflineSync
+        from src.core.logic.perception import PerceptionLoader
+
+        http = create_session()
+        fdb = FirebaseCRUD(http=http, storage=storage)
+        store = LocalStore()
+        highscores = HighscoreQueue(fdb, store=store)
+        listeners = ListenerManager(fdb.storage)
+        leaderboard = Leaderboard(fdb, listeners=listeners)
+        highscores.confirmed.connect(leaderboard.record)
+        cls._instance = cls(
+            fdb=fdb,
+            http=http,
+            perception=PerceptionLoader.instance(),
+            assets=AssetCache.instance(),
+            store=store,
+            highscores=highscores,
+            sync=OfflineSync(fdb, store, highscores),
+            listeners=listeners,
+            leaderboard=leaderboard,
+        )
+        return cls._instance
+
+    @classmethod
+    def instance(cls):
+        return cls._instance
@@ -0,0 +1,65 @@
+import builtins
+import sys
+import time
+
+IMPORT_REPORT_FLAG = "--import-report"
+
+class ImportTimer:
+    """
+    Startup import profiler, like python -X importtime but built into the game
+
+    Wraps builtins.__import__ and records every import statement that loaded new
+    modules, with its own (self) time and the time including nested imports.
+    Start the game with --import-report to print the slowest imports once the
+    menu is on screen.
+    """
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.records = []  # (name, self_us, cumulative_us, depth)
+        self.stack = []  # cumulative time of nested imports, per open import
+        self.original_import = None
+
+    @classmethod
+    def from_argv(cls, argv):
+        """Installed timer if the report flag was passed, otherwise None"""
+        if IMPORT_REPORT_FLAG not in argv:
+            return None
+        argv.remove(IMPORT_REPORT_FLAG)
+        timer = cls()
+        timer.install()
+        return timer
+
+    def install(self):
+        self.original_import = builtins.__import__
+        builtins.__import__ = self._timed_import
+
+    def uninstall(self):
+        if self.original_import is not None:
+            builtins.__import__ = self.original_import
+            self.original_import = None
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        modules_before = len(sys.modules)
+        self.stack.append(0)
+        start = time.perf_counter()
+        try:
+            return self.original_import(name, globals, locals, fromlist, level)
+        finally:
+            cumulative = int((time.perf_counter() - start) * 1_000_000)
+            children = self.stack.pop()
+            if self.stack:
+                self.stack[-1] += cumulative
+            if len(sys.modules) > modules_before:
+                self.records.append(("." * level + name, cumulative - children, cumulative, len(self.stack)))
+
+    def report(self, limit=25):
+        """Print the slowest top-level imports and stop timing"""
+        self.uninstall()
+        elapsed_ms = (time.perf_counter() - self.started) * 1000
+        top_level = [record for record in self.records if record[3] == 0]
+        import_ms = sum(record[2] for record in top_level) / 1000
+        print(f"Startup: menu shown after {elapsed_ms:.0f} ms, {import_ms:.0f} ms of it importing "
+              f"{len(self.records)} modules")
+        print("import time: self [us] | cumulative | imported package")
+        for name, self_us, cumulative_us, depth in sorted(self.records, key=lambda record: -record[2])[:limit]:
+            print(f"import time: {self_us:>9} | {cumulative_us:>10} | {'  ' * depth}{name}")
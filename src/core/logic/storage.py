@@ -0,0 +1,563 @@
+import json
+import os
+import random
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+
+STORAGE_FLAG = "--storage"
+STORAGE_KINDS = ("admin", "memory", "sqlite")
+
+# Per multi-path update request; the SDK rejects writes over 16 MB
+MAX_UPDATE_PATHS = 1000
+MAX_UPDATE_BYTES = 4 * 1024 * 1024
+# Seconds between runs of a query followed on the live database
+QUERY_POLL_INTERVAL = 10.0
+
+PUSH_CHARS = "-0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyz"
+_last_push = [0, []]  # timestamp in ms, random part of the last id
+_push_lock = threading.Lock()
+
+def push_id():
+    """
+    Firebase-style push key generated locally
+
+    8 characters of millisecond timestamp and 12 random ones; keys created later sort
+    later, also within the same millisecond, exactly like the keys push() returns.
+    """
+    with _push_lock:
+        now = int(time.time() * 1000)
+        if now == _last_push[0]:
+            # Same millisecond: increment the random part so the order is kept
+            random_part = _last_push[1]
+            i = 11
+            while i >= 0 and random_part[i] == 63:
+                random_part[i] = 0
+                i -= 1
+            if i >= 0:
+                random_part[i] += 1
+        else:
+            random_part = [random.randrange(64) for _ in range(12)]
+        _last_push[0], _last_push[1] = now, random_part
+    timestamp = []
+    for _ in range(8):
+        timestamp.append(PUSH_CHARS[now % 64])
+        now //= 64
+    return "".join(reversed(timestamp)) + "".join(PUSH_CHARS[i] for i in random_part)
+
+def storage_from_argv(argv, default="admin"):
+    """Backend kind from --storage=admin|memory|sqlite, removed from argv"""
+    kind = default
+    for arg in list(argv):
+        if arg.startswith(STORAGE_FLAG + "="):
+            kind = arg.split("=", 1)[1]
+            argv.remove(arg)
+    if kind not in STORAGE_KINDS:
+        raise ValueError(f"Unknown storage '{kind}', expected one of: {', '.join(STORAGE_KINDS)}")
+    return kind
+
+def create_storage(kind, path=None):
+    """Storage backend for a kind from STORAGE_KINDS; admin needs firebase_admin initialized"""
+    if kind == "memory":
+        return MemoryStorage()
+    if kind == "sqlite":
+        return SQLiteStorage(path)
+    return AdminStorage()
+
+def _segments(path):
+    return [segment for segment in path.strip("/").split("/") if segment]
+
+def _join(path, child):
+    return "/".join(_segments(path) + _segments(child))
+
+class StorageEvent:
+    """Same fields as firebase_admin.db.Event"""
+    def __init__(self, event_type, path, data):
+        self.event_type = event_type
+        self.path = path
+        self.data = data
+
+class Storage(ABC):
+    """
+    Realtime Database operations the game uses
+
+    Paths are slash separated and relative to the database root. query() returns an
+    OrderedDict in query order, transaction() aborts if its function raises, and
+    listen() callbacks get StorageEvents with the fields of firebase_admin's events,
+    on a thread of the backend's choosing.
+    """
+    @abstractmethod
+    def get(self, path):
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(self, path, value):
+        raise NotImplementedError
+
+    @abstractmethod
+    def update(self, path, values):
+        """Set several children of path at once; keys may be nested paths"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def push(self, path, value):
+        """Store value under a new push key and return the key"""
+        raise NotImplementedError
+
+    def delete(self, path):
+        self.set(path, None)
+
+    def update_chunked(self, path, values, max_paths=MAX_UPDATE_PATHS, max_bytes=MAX_UPDATE_BYTES):
+        """
+        update() split into as few requests as the size limits allow
+
+        Each chunk is atomic on its own, the whole update is not.
+
+        Returns:
+            Number of update requests made
+        """
+        requests = 0
+        chunk, size = {}, 0
+        for child, value in values.items():
+            value_size = len(child) + len(json.dumps(value)) + 4
+            if chunk and (len(chunk) >= max_paths or size + value_size > max_bytes):
+                self.update(path, chunk)
+                requests += 1
+                chunk, size = {}, 0
+            chunk[child] = value
+            size += value_size
+        if chunk:
+            self.update(path, chunk)
+            requests += 1
+        return requests
+
+    def push_many(self, path, values, **limits):
+        """Store every value under a new push key with multi-path updates; returns the keys"""
+        keys = [push_id() for _ in values]
+        self.update_chunked(path, dict(zip(keys, values)), **limits)
+        return keys
+
+    def delete_many(self, path, keys, **limits):
+        """Delete children of path with multi-path updates; returns the number of requests"""
+        return self.update_chunked(path, {key: None for key in keys}, **limits)
+
+    @abstractmethod
+    def shallow_keys(self, path):
+        """Keys of the children of path, without downloading their values"""
+        raise NotImplementedError
+
+    def iter_children(self, path, page_size=100, shallow=False):
+        """
+        Yield (key, value) for every child of path in key order, one page at a time
+
+        Pages are order_by_key().start_at(last key).limit_to_first(page_size) queries,
+        so memory stays bounded by the page size however large the node is. With
+        shallow, all keys are fetched first (useful for a total) and each page is
+        read as a start_at/end_at range of them.
+        """
+        if shallow:
+            keys = sorted(self.shallow_keys(path), key=_key_rank)
+            for i in range(0, len(keys), page_size):
+                page = keys[i:i + page_size]
+                yield from self.query(path, order_by="key", start_at=page[0], end_at=page[-1]).items()
+            return
+
+        last_key = None
+        while True:
+            if last_key is None:
+                page = self.query(path, order_by="key", limit_to_first=page_size)
+            else:
+                # start_at is inclusive, so fetch one more and skip the last key of the previous page
+                page = self.query(path, order_by="key", start_at=last_key, limit_to_first=page_size + 1)
+                page.pop(last_key, None)
+            yield from page.items()
+            if len(page) < page_size:
+                return
+            last_key = next(reversed(page))
+
+    @abstractmethod
+    def query(self, path, order_by="key", start_at=None, end_at=None, equal_to=None,
+              limit_to_first=None, limit_to_last=None):
+        """
+        Children of path ordered by "key", "value" or a child path, then filtered
+
+        Returns:
+            OrderedDict of the matching children
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def transaction(self, path, function):
+        """Replace the value at path with function(current) atomically; returns the new value"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def listen(self, path, callback, **query):
+        """
+        Call callback(event) on every change below path; returns an object with close()
+
+        With query arguments (those of query()) only the matching children are
+        followed, so a limited query never downloads the rest of the node. Opening a
+        listener may connect to the server; do it off the GUI thread.
+        """
+        raise NotImplementedError
+
+class AdminStorage(Storage):
+    """The live database through the firebase_admin SDK"""
+    def __init__(self):
+        from firebase_admin import db
+        self.db = db
+
+    def get(self, path):
+        return self.db.reference(path).get()
+
+    def set(self, path, value):
+        self.db.reference(path).set(value)
+
+    def update(self, path, values):
+        self.db.reference(path).update(values)
+
+    def push(self, path, value):
+        return self.db.reference(path).push(value).key
+
+    def delete(self, path):
+        self.db.reference(path).delete()
+
+    def query(self, path, **query):
+        return OrderedDict(self._query(self.db.reference(path), **query).get() or {})
+
+    def _query(self, ref, order_by="key", start_at=None, end_at=None, equal_to=None,
+               limit_to_first=None, limit_to_last=None):
+        if order_by == "key":
+            query = ref.order_by_key()
+        elif order_by == "value":
+            query = ref.order_by_value()
+        else:
+            query = ref.order_by_child(order_by)
+        if start_at is not None:
+            query = query.start_at(start_at)
+        if end_at is not None:
+            query = query.end_at(end_at)
+        if equal_to is not None:
+            query = query.equal_to(equal_to)
+        if limit_to_first is not None:
+            query = query.limit_to_first(limit_to_first)
+        if limit_to_last is not None:
+            query = query.limit_to_last(limit_to_last)
+        return query
+
+    def shallow_keys(self, path):
+        return list(self.db.reference(path).get(shallow=True) or {})
+
+    def transaction(self, path, function):
+        return self.db.reference(path).transaction(function)
+
+    def listen(self, path, callback, **query):
+        if not query:
+            return self.db.reference(path).listen(callback)
+        # The SDK streams only whole references; a stream of the node would download
+        # every child, so a query is followed by re-running it instead
+        return _QueryPoller(self, path, callback, query)
+
+class _QueryPoller:
+    """
+    Listener registration for a query on the live database
+
+    Runs the (bounded) query every interval seconds on its own thread and sends the
+    result as a put at "/" whenever it changed, the first one right away.
+    """
+    def __init__(self, storage, path, callback, query, interval=QUERY_POLL_INTERVAL):
+        self.storage = storage
+        self.path = path
+        self.callback = callback
+        self.query = query
+        self.interval = interval
+        self.closed = threading.Event()
+        self.thread = threading.Thread(target=self._run, name=f"QueryPoller {path}", daemon=True)
+        self.thread.start()
+
+    def _run(self):
+        last = None
+        first = True
+        while not self.closed.is_set():
+            try:
+                result = dict(self.storage.query(self.path, **self.query)) or None
+                if first or result != last:
+                    first, last = False, result
+                    self.callback(StorageEvent("put", "/", result))
+            except Exception as e:
+                print(f"Error polling {self.path}: {e}")
+            self.closed.wait(self.interval)
+
+    def close(self):
+        self.closed.set()
+
+def _value_rank(value):
+    """Sort key following the Realtime Database order: null, false, true, numbers, strings, objects"""
+    if value is None:
+        return (0,)
+    if value is False:
+        return (1,)
+    if value is True:
+        return (2,)
+    if isinstance(value, (int, float)):
+        return (3, value)
+    if isinstance(value, str):
+        return (4, value)
+    return (5,)
+
+def _key_rank(key):
+    """Integer-like keys first, numerically, then the rest as strings"""
+    try:
+        return (0, int(key), "")
+    except ValueError:
+        return (1, 0, key)
+
+class _Registration:
+    def __init__(self, storage, entry):
+        self.storage = storage
+        self.entry = entry
+
+    def close(self):
+        with self.storage.lock:
+            self.storage.listeners = [entry for entry in self.storage.listeners if entry is not self.entry]
+
+class _TreeStorage(Storage):
+    """
+    Shared RTDB semantics for the local backends
+
+    Subclasses only read and write whole subtrees (_read, _write). Setting None
+    deletes, empty objects disappear, and listeners are called on the writing thread
+    after the write is done.
+    """
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.listeners = []  # [segments, callback, query arguments, last query result]
+
+    @abstractmethod
+    def _read(self, segments):
+        raise NotImplementedError
+
+    @abstractmethod
+    def _write(self, segments, value):
+        raise NotImplementedError
+
+    def get(self, path):
+        with self.lock:
+            return self._read(_segments(path))
+
+    def set(self, path, value):
+        segments = _segments(path)
+        with self.lock:
+            self._write(segments, value)
+            events = self._events(segments, "put", value)
+        self._dispatch(events)
+
+    def update(self, path, values):
+        segments = _segments(path)
+        with self.lock:
+            for child, value in values.items():
+                self._write(segments + _segments(child), value)
+            events = self._events(segments, "patch", dict(values))
+        self._dispatch(events)
+
+    def push(self, path, value):
+        key = push_id()
+        self.set(_join(path, key), value)
+        return key
+
+    def shallow_keys(self, path):
+        children = self.get(path)
+        return list(children) if isinstance(children, dict) else []
+
+    def query(self, path, order_by="key", start_at=None, end_at=None, equal_to=None,
+              limit_to_first=None, limit_to_last=None):
+        children = self.get(path)
+        if not isinstance(children, dict):
+            return OrderedDict()
+
+        if order_by == "key":
+            def filter_rank(item):
+                return _key_rank(item[0])
+            bound_rank = _key_rank
+        else:
+            def filter_rank(item):
+                value = item[1]
+                if order_by != "value":
+                    for segment in _segments(order_by):
+                        value = value.get(segment) if isinstance(value, dict) else None
+                return _value_rank(value)
+            bound_rank = _value_rank
+
+        # Equal values are ordered by key
+        items = sorted(children.items(), key=lambda item: (filter_rank(item), _key_rank(item[0])))
+        if equal_to is not None:
+            start_at = end_at = equal_to
+        if start_at is not None:
+            items = [item for item in items if filter_rank(item) >= bound_rank(start_at)]
+        if end_at is not None:
+            items = [item for item in items if filter_rank(item) <= bound_rank(end_at)]
+        if limit_to_first is not None:
+            items = items[:limit_to_first]
+        if limit_to_last is not None:
+            items = items[-limit_to_last:] if limit_to_last else []
+        return OrderedDict(items)
+
+    def transaction(self, path, function):
+        segments = _segments(path)
+        with self.lock:
+            value = function(self._read(segments))
+            self._write(segments, value)
+            events = self._events(segments, "put", value)
+        self._dispatch(events)
+        return value
+
+    def listen(self, path, callback, **query):
+        entry = [_segments(path), callback, query, None]
+        with self.lock:
+            self.listeners.append(entry)
+            if query:
+                current = entry[3] = dict(self.query(path, **query)) or None
+            else:
+                current = self._read(entry[0])
+        callback(StorageEvent("put", "/", current))
+        return _Registration(self, entry)
+
+    def _events(self, segments, event_type, data):
+        """Events for every listener affected by a write at segments; call with the lock held"""
+        events = []
+        for entry in self.listeners:
+            listener_segments, callback, query, last = entry
+            depth = len(listener_segments)
+            if query:
+                if segments[:depth] == listener_segments or listener_segments[:len(segments)] == segments:
+                    # Query listeners get the whole (bounded) result again when it changed
+                    result = dict(self.query("/".join(listener_segments), **query)) or None
+                    if result != last:
+                        entry[3] = result
+                        events.append((callback, StorageEvent("put", "/", result)))
+            elif segments[:depth] == listener_segments:
+                relative = "/" + "/".join(segments[depth:])
+                events.append((callback, StorageEvent(event_type, relative, data)))
+            elif listener_segments[:len(segments)] == segments:
+                # Written above the listener: it sees its own subtree replaced
+                events.append((callback, StorageEvent("put", "/", self._read(listener_segments))))
+        return events
+
+    def _dispatch(self, events):
+        for callback, event in events:
+            try:
+                callback(event)
+            except Exception as e:
+                print(f"Error in storage listener: {e}")
+
+class MemoryStorage(_TreeStorage):
+    """Database tree kept in a dict, for running and benchmarking without a network"""
+    def __init__(self, data=None):
+        super().__init__()
+        self.root = json.loads(json.dumps(data)) if data else {}
+
+    def _read(self, segments):
+        node = self.root
+        for segment in segments:
+            if not isinstance(node, dict) or segment not in node:
+                return None
+            node = node[segment]
+        if node == {}:
+            return None
+        # Copies, so callers cannot change the tree behind the lock
+        return json.loads(json.dumps(node)) if isinstance(node, (dict, list)) else node
+
+    def _write(self, segments, value):
+        value = json.loads(json.dumps(value)) if isinstance(value, (dict, list)) else value
+        if not segments:
+            self.root = value if isinstance(value, dict) else {}
+            return
+        parents = [self.root]
+        node = self.root
+        for segment in segments[:-1]:
+            child = node.get(segment)
+            if not isinstance(child, dict):
+                if value is None:
+                    return  # Nothing to delete
+                child = node[segment] = {}
+            node = child
+            parents.append(node)
+        if value is None or value == {}:
+            node.pop(segments[-1], None)
+            # Remove parents left empty, like the server does
+            for depth in range(len(parents) - 1, 0, -1):
+                if parents[depth]:
+                    break
+                parents[depth - 1].pop(segments[depth - 1], None)
+        else:
+            node[segments[-1]] = value
+
+class SQLiteStorage(_TreeStorage):
+    """
+    Database tree persisted in SQLite, one row per leaf
+
+    A subtree is a range scan on the path column, so reads below a node never load
+    the rest of the tree.
+    """
+    def __init__(self, path=None):
+        super().__init__()
+        if path is None:
+            from src.core.logic.local_store import default_path
+            path = os.path.join(os.path.dirname(default_path()), "storage.db")
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.path = path
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        with self.connection:
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute("CREATE TABLE IF NOT EXISTS nodes (path TEXT PRIMARY KEY, value TEXT)")
+
+    def _read(self, segments):
+        path = "/".join(segments)
+        if path:
+            # '0' sorts right after '/', so this range holds exactly the descendants
+            rows = self.connection.execute(
+                "SELECT path, value FROM nodes WHERE path = ? OR (path > ? AND path < ?)",
+                (path, path + "/", path + "0")
+            ).fetchall()
+        else:
+            rows = self.connection.execute("SELECT path, value FROM nodes").fetchall()
+        if not rows:
+            return None
+        tree = {}
+        for row_path, value in rows:
+            relative = row_path[len(path):].strip("/")
+            if not relative:
+                return json.loads(value)  # A leaf
+            node = tree
+            keys = relative.split("/")
+            for key in keys[:-1]:
+                node = node.setdefault(key, {})
+            node[keys[-1]] = json.loads(value)
+        return tree
+
+    def _write(self, segments, value):
+        path = "/".join(segments)
+        with self.connection:
+            if path:
+                self.connection.execute(
+                    "DELETE FROM nodes WHERE path = ? OR (path > ? AND path < ?)", (path, path + "/", path + "0")
+                )
+                # A leaf above the new value becomes an object
+                ancestors = ["/".join(segments[:depth]) for depth in range(1, len(segments))]
+                self.connection.executemany("DELETE FROM nodes WHERE path = ?", [(a,) for a in ancestors])
+            else:
+                self.connection.execute("DELETE FROM nodes")
+            rows = []
+            self._flatten(path, value, rows)
+            self.connection.executemany("INSERT INTO nodes VALUES (?, ?)", rows)
+
+    def _flatten(self, path, value, rows):
+        if isinstance(value, dict):
+            for key, child in value.items():
+                self._flatten(f"{path}/{key}" if path else str(key), child, rows)
+        elif value is not None:
+            rows.append((path, json.dumps(value)))
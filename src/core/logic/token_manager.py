@@ -0,0 +1,133 @@
+import base64
+import json
+import threading
+import time
+
+from PyQt6.QtCore import QObject, Qt, QTimer, pyqtSignal
+
+# Refresh this long before the ID token expires; Firebase ID tokens live one hour
+TOKEN_REFRESH_MARGIN = 5 * 60
+# Wait before trying again after a refresh failed, e.g. while offline
+TOKEN_RETRY_DELAY = 30
+
+def token_expiry(id_token):
+    """exp claim of a JWT in seconds since the epoch, or 0 if it cannot be read"""
+    try:
+        payload = id_token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        return int(json.loads(base64.urlsafe_b64decode(payload))["exp"])
+    except Exception:
+        return 0
+
+class TokenManager(QObject):
+    """
+    Keeps the signed-in player's ID token valid
+
+    The expiry is read from the token itself, so valid_token() answers from memory
+    while the token is fresh. A timer refreshes it in the background margin seconds
+    before it expires. Refreshes are deduplicated: callers that need a token while
+    one is running wait for it instead of starting another. refreshed(tokens) and
+    expired() are emitted on the GUI thread; expired means the refresh token was
+    rejected and the player has to sign in again.
+    """
+    refreshed = pyqtSignal(object)  # {"idToken", "refreshToken"}
+    expired = pyqtSignal()
+    _tokens_changed = pyqtSignal()
+
+    def __init__(self, fdb, margin=TOKEN_REFRESH_MARGIN, parent=None):
+        super().__init__(parent)
+        self.fdb = fdb
+        self.margin = margin
+        self.id_token = None
+        self.refresh_token = None
+        self.expires_at = 0
+        self.rejected = False
+        self.retry_at = 0
+        self.refreshing = None  # threading.Event of the refresh in flight
+        self.lock = threading.Lock()
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.refresh_in_background)
+        # Tokens may change on worker threads; the timer lives on the GUI thread
+        self._tokens_changed.connect(self._schedule_refresh, Qt.ConnectionType.QueuedConnection)
+
+    def set_tokens(self, id_token, refresh_token):
+        with self.lock:
+            self.id_token = id_token
+            self.refresh_token = refresh_token
+            self.expires_at = token_expiry(id_token)
+            self.rejected = False
+            self.retry_at = 0
+        self._tokens_changed.emit()
+
+    def clear(self):
+        with self.lock:
+            self.id_token = self.refresh_token = None
+            self.expires_at = 0
+        self._tokens_changed.emit()
+
+    def seconds_left(self):
+        return self.expires_at - time.time()
+
+    def valid_token(self, timeout=10.0):
+        """The ID token, refreshed first only if it expires within a minute; None if that fails"""
+        with self.lock:
+            if self.id_token and self.expires_at - time.time() > 60:
+                return self.id_token
+        return self.refresh(timeout)
+
+    def refresh(self, timeout=10.0):
+        """Refresh now, or wait for the refresh already running; returns the ID token or None"""
+        with self.lock:
+            if self.refresh_token is None:
+                return None
+            running = self.refreshing
+            if running is None:
+                self.refreshing = threading.Event()
+                refresh_token = self.refresh_token
+        if running is not None:
+            running.wait(timeout)
+            with self.lock:
+                return self.id_token if self.id_token and self.expires_at > time.time() else None
+
+        result = None
+        try:
+            result = self.fdb.refresh_user(refresh_token)
+        finally:
+            with self.lock:
+                done, self.refreshing = self.refreshing, None
+                if self.refresh_token != refresh_token:
+                    outcome = "stale"  # Signed out or in again meanwhile
+                elif isinstance(result, dict) and 'idToken' in result:
+                    outcome = "refreshed"
+                    self.id_token = result['idToken']
+                    self.refresh_token = result['refreshToken']
+                    self.expires_at = token_expiry(self.id_token)
+                    self.retry_at = 0
+                elif result == "TOKEN_EXPIRED":
+                    outcome = "rejected"
+                    self.rejected = True
+                else:
+                    outcome = "failed"
+                    self.retry_at = time.time() + TOKEN_RETRY_DELAY
+                tokens = {'idToken': self.id_token, 'refreshToken': self.refresh_token}
+            done.set()
+
+        if outcome == "rejected":
+            self.expired.emit()
+            return None
+        self._tokens_changed.emit()  # Schedules the next refresh, or the retry
+        if outcome == "refreshed":
+            self.refreshed.emit(tokens)
+            return tokens['idToken']
+        return None
+
+    def refresh_in_background(self):
+        threading.Thread(target=self.refresh, daemon=True).start()
+
+    def _schedule_refresh(self):
+        self.timer.stop()
+        if self.refresh_token is None or self.rejected or self.refreshing is not None:
+            return  # A running refresh schedules the next one when it finishes
+        due = max(self.expires_at - self.margin, self.retry_at)
+        self.timer.start(int(max(due - time.time(), 0) * 1000))
@@ -1,30 +1,61 @@
 import sys
 import os
-from dotenv import load_dotenv
-from firebase_admin import credentials, initialize_app, db
 
 # Add the parent directory of 'src' to the Python path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+# Time every import from here on when started with --import-report
+from src.core.logic.startup_profile import ImportTimer
+import_timer = ImportTimer.from_argv(sys.argv)
+
+# --storage=memory or --storage=sqlite runs the game without the live database
+from src.core.logic.storage import create_storage, storage_from_argv
+storage_kind = storage_from_argv(sys.argv)
+
+from dotenv import load_dotenv
+from firebase_admin import credentials, initialize_app, db
+
 from PyQt6.QtWidgets import QApplication, QMainWindow, QWidget, QVBoxLayout, QLabel, QPushButton, QButtonGroup
+from PyQt6.QtCore import QTimer
 
 
 
 def main() -> None:
     app = QApplication(sys.argv)
 
+    # Resolve all assets once and report anything missing before the game starts
+    from src.core.logic.asset_manifest import verify_required_assets
+    verify_required_assets()
+
+    # Decode all images in the background while Firebase and the menu start up
+    from src.core.logic.asset_cache import AssetCache
+    AssetCache.instance().preload()
+    app.aboutToQuit.connect(AssetCache.instance().report)
+
     load_dotenv()
-    cred_path = os.getenv('FIREBASE_CREDENTIALS_PATH')
-    db_url = os.getenv('FIREBASE_DATABASE_URL')
-    if not cred_path or not db_url:
-        raise ValueError("Environment variables FIREBASE_CREDENTIALS_PATH and FIREBASE_DATABASE_URL must be set.")
-    cred = credentials.Certificate(cred_path)
-    initialize_app(cred, {'databaseURL': db_url})
-    
-    from src.scenes.menu.menu_window import Menu
-    window = Menu()
-
-    window.show()
+    if storage_kind == "admin":
+        cred_path = os.getenv('FIREBASE_CREDENTIALS_PATH')
+        db_url = os.getenv('FIREBASE_DATABASE_URL')
+        if not cred_path or not db_url:
+            raise ValueError("Environment variables FIREBASE_CREDENTIALS_PATH and FIREBASE_DATABASE_URL must be set.")
+        cred = credentials.Certificate(cred_path)
+        initialize_app(cred, {'databaseURL': db_url})
+    else:
+        print(f"Using local {storage_kind} storage instead of the Realtime Database")
+
+    # Clients shared by every scene; camera and models are warmed up from the menu
+    from src.core.logic.services import Services
+    services = Services.create(create_storage(storage_kind))
+    app.aboutToQuit.connect(services.perception.shutdown)
+    app.aboutToQuit.connect(services.highscores.flush)
+    app.aboutToQuit.connect(services.listeners.close_all)
+
+    # One window owns the menu and the game scene for the whole session
+    from src.scenes.app_shell import AppShell
+    window = AppShell(services)
+    window.showFullScreen()
+    if import_timer:
+        QTimer.singleShot(0, import_timer.report)
 
     # Start the event loop
     sys.exit(app.exec())
@@ -188,12 +188,9 @@ class Pause(QWidget):
         
     def back_to_menu_fn(self):
         """Return to main menu"""
-        from src.scenes.menu.menu_window import Menu
         self.hide()
-        if self.parent:
-            self.parent.close()
-        self.menu = Menu()
-        self.menu.showFullScreen()
+        if self.parent and hasattr(self.parent, 'back_to_menu'):
+            self.parent.back_to_menu()
 
     def quit_game_fn(self):
         """Quit the application"""
@@ -0,0 +1,51 @@
+from PyQt6.QtWidgets import QMainWindow, QStackedWidget
+
+from src.scenes.menu.menu_window import Menu
+
+class AppShell(QMainWindow):
+    """
+    Top-level window owning the menu and the game scene for the whole session
+
+    Switching between them only changes the page of a stacked widget. The game scene
+    is built on the first Start and reset, not rebuilt, for every later round.
+    """
+    _instance = None
+
+    def __init__(self, services=None, parent=None):
+        super().__init__(parent)
+        AppShell._instance = self
+        self.services = services
+        self.setWindowTitle("Dr1veThr0")
+
+        self.stacked_widget = QStackedWidget(self)
+        self.setCentralWidget(self.stacked_widget)
+
+        self.menu = Menu(self.stacked_widget, services=services)
+        self.stacked_widget.addWidget(self.menu)
+        self.game = None
+
+    @classmethod
+    def instance(cls):
+        return cls._instance
+
+    def start_game(self, mode):
+        """Show the game scene and start a new round in the given mode"""
+        self.menu.stop_leaderboard()
+        if self.game is None:
+            # Game scenes and the camera stack are only imported once the player starts
+            from src.scenes.test import Test
+            self.game = Test(
+                auth_handler=self.menu.auth_handler, current_game_mode=mode,
+                parent=self.stacked_widget, services=self.services
+            )
+            self.stacked_widget.addWidget(self.game)
+        self.stacked_widget.setCurrentWidget(self.game)
+        self.game.start_round(mode)
+        self.game.setFocus()
+
+    def show_menu(self):
+        """Freeze the game scene and go back to the menu"""
+        if self.game is not None:
+            self.game.stop_round()
+        self.stacked_widget.setCurrentWidget(self.menu)
+        self.menu.refresh_leaderboard()
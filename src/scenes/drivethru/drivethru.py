@@ -1,15 +1,24 @@
-from PyQt6.QtWidgets import QWidget
-from PyQt6.QtCore import Qt, QTimer, QTime
-from PyQt6.QtGui import QPainter, QPixmap
-from src.core.logic.abstract_functions import get_resource_path
-
-class DriveThruGame(QWidget):
-    def __init__(self, parent=None, width=605, height=400):
-        super().__init__(parent)
+from PyQt6.QtWidgets import QGraphicsRectItem, QGraphicsPixmapItem, QGraphicsItem
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QPen
+from src.core.logic.asset_cache import AssetCache
+from src.core.logic.asset_pipeline import car_target_size
+from src.core.logic.game_clock import GameClock
+
+class DriveThruGame(QGraphicsRectItem):
+    """
+    Order window of the drive-thru scene: clips the moving car to its bounds
+
+    A graphics item cannot own a QObject, so the GameClock driving the car is the
+    window's shared one and required.
+    """
+    def __init__(self, clock, parent=None, width=605, height=400):
+        super().__init__(0, 0, width, height, parent)
         self.width = width
         self.height = height
-        self.setFixedSize(self.width, self.height)
-        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, True)  # Allow clicks to pass through
+        self.setPen(QPen(Qt.PenStyle.NoPen))
+        self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemClipsChildrenToShape, True)
+        self.setAcceptedMouseButtons(Qt.MouseButton.NoButton)  # Allow clicks to pass through
 
         self.x = float(self.width)  # Start off-screen
         self.y = int(self.height * 0.125)  # 12.5% of height (50/400)
@@ -17,71 +26,63 @@ class DriveThruGame(QWidget):
         self.middle_reached = False
         self.paused = False
         self.seconds_to_order = 20
-        self.order_start_time = None  # Will store QTime
+        self.order_start_time = None  # Game clock time in ms
         self.remaining_time = 0
 
-        # Load car image
-        self.car_image = QPixmap(get_resource_path("img/car2.png")).scaled(
-            int(self.width * 2.644),  # 264.4% of width (1600/605)
-            int(self.height * 2),  # 200% of height (800/400)
-            Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation
+        # Load car image; pre-built sprites are trimmed, so position by the untrimmed size
+        self.car_image, car_offset, car_size = AssetCache.instance().sprite(
+            "img/car2.png", car_target_size(self.width, self.height)
         )
+        self.car_width = car_size.width()
 
-        # Timer for animation
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_position)
-        self.timer.start(16)  # ~60 FPS
+        # The car is the only moving item; the view repaints just the area it covers
+        self.car_item = QGraphicsPixmapItem(self.car_image, self)
+        self.car_item.setOffset(car_offset.x(), car_offset.y())
+        self.car_item.setPos(self.x, self.y)
+
+        # Animation is driven by the shared game clock
+        self.clock = clock
+        self.clock.subscribe(self.update_position, GameClock.ANIMATION)
 
     def set_paused(self, paused):
         """Set the pause state"""
         self.paused = paused
         if not paused and self.middle_reached and self.order_start_time is None:
-            self.order_start_time = QTime.currentTime()
+            self.order_start_time = self.clock.now()
 
-    def update(self, seconds_to_order):
-        """Update game state"""
-        self.seconds_to_order = seconds_to_order
-        if not self.paused:
-            self.process_events()
-        super().update()
+    def move_car(self, x):
+        """Move the car item; the scene invalidates only its old and new bounds"""
+        self.x = x
+        self.car_item.setPos(int(self.x), self.y)
 
-    def update_position(self):
-        """Update car position"""
+    def update_position(self, delta=GameClock.FRAME_MS):
+        """Update car position by the game time elapsed since the last tick"""
         if self.paused:
-            self.update(self.seconds_to_order)
             return
 
-        middle_x = self.width / 2 - (self.car_image.width() / 2)
-        if not self.middle_reached and middle_x - self.speed < self.x <= middle_x:
+        # Speed is given per 16 ms frame, so late ticks move the car proportionally further
+        step = self.speed * delta / GameClock.FRAME_MS
+        middle_x = self.width / 2 - (self.car_width / 2)
+        if not self.middle_reached and middle_x - step < self.x <= middle_x:
             self.middle_reached = True
-            self.order_start_time = QTime.currentTime()
-
-        if not self.middle_reached and self.x > -self.car_image.width():
-            self.x -= self.speed
-        elif not self.middle_reached and self.x <= -self.car_image.width():
-            self.x = float(self.width)
+            self.order_start_time = self.clock.now()
 
-        self.update(self.seconds_to_order)
+        if not self.middle_reached and self.x > -self.car_width:
+            self.move_car(self.x - step)
+        elif not self.middle_reached and self.x <= -self.car_width:
+            self.move_car(float(self.width))
 
     def process_events(self):
         """Process timer events"""
-        if self.paused or not self.middle_reached or not self.order_start_time:
+        if self.paused or not self.middle_reached or self.order_start_time is None:
             return
 
-        current_time = QTime.currentTime()
-        elapsed_time = self.order_start_time.msecsTo(current_time)
+        elapsed_time = self.clock.now() - self.order_start_time
         self.remaining_time = max(0, self.seconds_to_order * 1000 - elapsed_time)
 
         if self.remaining_time <= 0:
             self.middle_reached = False
-            self.x -= self.speed
-
-    def paintEvent(self, event):
-        """Paint the car"""
-        painter = QPainter(self)
-        painter.fillRect(self.rect(), Qt.GlobalColor.transparent)
-        painter.drawPixmap(int(self.x), self.y, self.car_image)
-        painter.end()
+            self.move_car(self.x - self.speed)
 
     def get_remaining_time(self):
         """Get the current remaining time in milliseconds"""
@@ -92,8 +93,8 @@ class DriveThruGame(QWidget):
         self.remaining_time = 0
         self.middle_reached = False
         self.order_start_time = None
-        self.x = float(self.width)
+        self.move_car(float(self.width))
 
     def set_order_time(self, time):
         """Set the order time in seconds"""
-        self.seconds_to_order = time
\ No newline at end of file
+        self.seconds_to_order = time
@@ -1,74 +1,117 @@
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel
-from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtGui import QPixmap, QPalette, QBrush
-from src.core.logic.abstract_functions import get_resource_path
+from PyQt6.QtWidgets import QGraphicsView, QGraphicsScene, QGraphicsPixmapItem, QGraphicsItem, QFrame
+from PyQt6.QtCore import Qt, QSize
+from PyQt6.QtGui import QPainter, QTransform
+from src.core.logic.asset_cache import AssetCache
+from src.core.logic.asset_pipeline import sprite_target_sizes, foreground_origin, render_size
+from src.core.logic.game_clock import GameClock
 from src.scenes.drivethru.drivethru import DriveThruGame
 
-class WholeDriveThruWindow(QWidget):
-    def __init__(self, parent=None, width=1280, height=960):
+class WholeDriveThruWindow(QGraphicsView):
+    """
+    Drive-thru scene composited on a QGraphicsScene
+
+    Background and foreground are static items cached in device coordinates, so a frame
+    only redraws the region the car moved through instead of repainting every layer.
+    On screens larger than the capped render size the scene is laid out at that size
+    and the view scales it up on blit instead of holding screen-sized pixmaps.
+    """
+    SOURCE_IMAGES = ("img/drivetrhu.jpg", "img/drivethru_ablak.png", "img/car2.png")
+
+    def __init__(self, parent=None, width=1280, height=960, clock=None):
         super().__init__(parent)
+        if clock is None:
+            clock = GameClock(self)
+            clock.start()
+        self.clock = clock
         self.width = max(width, 1280)
         self.height = max(height, 960)
         self.setFixedSize(self.width, self.height)
         self.seconds_to_order = 20
         self.remaining_time = 0
 
+        self.scene_width, self.scene_height = render_size(self.width, self.height)
+        self.graphics_scene = QGraphicsScene(0, 0, self.scene_width, self.scene_height, self)
+        self.graphics_scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.NoIndex)
+        self._setup_view()
+
+        assets = AssetCache.instance()
+
         # Set background image
-        self.background_image = QPixmap(get_resource_path("img/drivetrhu.jpg")).scaled(
-            self.width, self.height, Qt.AspectRatioMode.IgnoreAspectRatio, Qt.TransformationMode.SmoothTransformation
-        )
-        palette = QPalette()
-        palette.setBrush(QPalette.ColorRole.Window, QBrush(self.background_image))
-        self.setPalette(palette)
-        self.setAutoFillBackground(True)
+        self.background_image = assets.pixmap("img/drivetrhu.jpg", QSize(self.scene_width, self.scene_height))
+        self.background_item = self._add_static_item(self.background_image, 0, 0, z=0)
 
         # Initialize DriveThruGame
-        self.order_window = DriveThruGame(self, width=int(self.width * 0.406), height=int(self.height * 0.416))
-        self.order_window.move(
-            int(self.width * 0.191),  # 22.8% from left
-            int(self.height * 0.4)  # 51.1% from top
+        self.order_window = DriveThruGame(self.clock, width=int(self.scene_width * 0.406), height=int(self.scene_height * 0.416))
+        self.order_window.setPos(
+            int(self.scene_width * 0.191),  # 22.8% from left
+            int(self.scene_height * 0.4)  # 51.1% from top
         )
+        self.order_window.setZValue(1)
+        self.graphics_scene.addItem(self.order_window)
         self.order_window.set_order_time(self.seconds_to_order)
 
-        # Load foreground image
-        self.foreground_image = QPixmap(get_resource_path("img/drivethru_ablak.png"))
+        # Foreground item, vertically centred in its box like the label it replaces;
+        # pre-built sprites only contain the on-screen part, placed at their offset
+        foreground_target = sprite_target_sizes(self.scene_width, self.scene_height)["img/drivethru_ablak.png"]
+        scaled_foreground, foreground_offset, foreground_size = assets.sprite("img/drivethru_ablak.png", foreground_target)
+        origin = foreground_origin(self.scene_width, self.scene_height, foreground_size)
+        self.foreground_item = self._add_static_item(
+            scaled_foreground,
+            origin.x() + foreground_offset.x(),
+            origin.y() + foreground_offset.y(),
+            z=2
+        )
 
-        # Static foreground position
-        self.foreground_x = -int(self.width * 0.02)
-        self.foreground_y = -int(self.height * 0.7)
-        self.foreground_width = int(self.width * 0.304 * 3.25)
-        self.foreground_height = int(self.height * 0.717 * 3.25)
+        # The scene holds its capped-resolution pixmaps now; full-size sources are not needed
+        assets.release(self.SOURCE_IMAGES)
 
-        # Create foreground label
-        self.foreground_label = QLabel(self)
-        scaled_foreground = self.foreground_image.scaled(
-            self.foreground_width, self.foreground_height,
-            Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation
-        )
-        self.foreground_label.setPixmap(scaled_foreground)
-        self.foreground_label.setGeometry(
-            self.foreground_x, self.foreground_y, self.foreground_width, self.foreground_height
-        )
-        self.foreground_label.raise_()
-
-        # Timer for updating the game
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_game)
-        self.timer.start(16)  # ~60 FPS
-
-        # Layout (empty)
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(
-            int(self.width * 0.191), int(self.height * 0.5),
-            int(self.width * 0.191), int(self.height * 0.5)
-        )
+        # Order countdown runs on the shared game clock, after the car animation
+        self.clock.subscribe(self.update_game, GameClock.COUNTDOWN)
+
+    def _setup_view(self):
+        """Show the scene full-window without scrollbars, frame or interaction"""
+        self.setScene(self.graphics_scene)
+        self.setSceneRect(0, 0, self.scene_width, self.scene_height)
+        self.setFrameShape(QFrame.Shape.NoFrame)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)
+        self.setInteractive(False)
+        self.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.MinimalViewportUpdate)
+        self.setOptimizationFlag(QGraphicsView.OptimizationFlag.DontSavePainterState, True)
+
+        scaled = (self.scene_width, self.scene_height) != (self.width, self.height)
+        if scaled:
+            self.setTransform(QTransform.fromScale(self.width / self.scene_width, self.height / self.scene_height))
+        self.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, scaled)
+        # A device cache of a scaled layer would be a screen-sized pixmap again
+        self.static_cache_mode = QGraphicsItem.CacheMode.NoCache if scaled else QGraphicsItem.CacheMode.DeviceCoordinateCache
+
+    def _add_static_item(self, pixmap, x, y, z):
+        """Add a pixmap layer that never changes and is rendered from a device cache"""
+        item = QGraphicsPixmapItem(pixmap)
+        item.setPos(x, y)
+        item.setZValue(z)
+        item.setCacheMode(self.static_cache_mode)
+        item.setAcceptedMouseButtons(Qt.MouseButton.NoButton)
+        self.graphics_scene.addItem(item)
+        return item
+
+    def resident_pixmap_bytes(self):
+        """Memory held for this scene: its pixmaps, device caches of the static layers and any cached sources"""
+        static_bytes = AssetCache.pixmap_bytes(self.background_image) + AssetCache.pixmap_bytes(self.foreground_item.pixmap())
+        if self.static_cache_mode == QGraphicsItem.CacheMode.DeviceCoordinateCache:
+            static_bytes *= 2
+        source_bytes = AssetCache.instance().source_bytes(self.SOURCE_IMAGES)
+        return static_bytes + AssetCache.pixmap_bytes(self.order_window.car_image) + source_bytes
 
-    def update_game(self):
-        """Update game logic and trigger repaint"""
+    def update_game(self, delta=GameClock.FRAME_MS):
+        """Update the order countdown; the car repaints its own dirty area"""
         if not self.order_window.paused:
-            self.order_window.update(self.seconds_to_order)
+            self.order_window.set_order_time(self.seconds_to_order)
+            self.order_window.process_events()
             self.remaining_time = self.order_window.get_remaining_time()
-            self.update()
 
     def get_remaining_time(self):
         """Get the remaining order time"""
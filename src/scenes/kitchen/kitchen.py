@@ -1,11 +1,19 @@
 from PyQt6.QtWidgets import QWidget
-from PyQt6.QtCore import Qt, QTimer, QTime
-from PyQt6.QtGui import QPalette, QBrush, QPixmap
-from src.core.logic.abstract_functions import get_resource_path
+from PyQt6.QtCore import Qt, QSize
+from PyQt6.QtGui import QPainter, QPixmap
+from src.core.logic.asset_cache import AssetCache
+from src.core.logic.asset_pipeline import render_size
+from src.core.logic.game_clock import GameClock
 
 class Kitchen(QWidget):
-    def __init__(self, parent=None, width=1280, height=960):
+    SOURCE_IMAGES = ("img/kitchen.jpg",)
+
+    def __init__(self, parent=None, width=1280, height=960, clock=None):
         super().__init__(parent)
+        if clock is None:
+            clock = GameClock(self)
+            clock.start()
+        self.clock = clock
         self.width = max(width, 1280)
         self.height = max(height, 960)
         self.setFixedSize(self.width, self.height)
@@ -14,31 +22,34 @@ class Kitchen(QWidget):
         self.paused = False
         self.order_start_time = None
 
-        # Set background image
+        # Set background image; kept at the capped render size and scaled up in paintEvent
+        scene_width, scene_height = render_size(self.width, self.height)
         try:
-            self.background_image = QPixmap(get_resource_path("img/kitchen.jpg")).scaled(
-                self.width, self.height, Qt.AspectRatioMode.IgnoreAspectRatio, Qt.TransformationMode.SmoothTransformation
-            )
+            self.background_image = AssetCache.instance().pixmap("img/kitchen.jpg", QSize(scene_width, scene_height))
         except:
-            self.background_image = QPixmap()
+            self.background_image = QPixmap(scene_width, scene_height)
             self.background_image.fill(Qt.GlobalColor.blue)  # Fallback blue background
+        AssetCache.instance().release(self.SOURCE_IMAGES)
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent)
+
+        # Remaining time only needs updating while the kitchen is on screen
+        self.clock.subscribe(self.update_time, GameClock.COUNTDOWN, widget=self)
 
-        palette = QPalette()
-        palette.setBrush(QPalette.ColorRole.Window, QBrush(self.background_image))
-        self.setPalette(palette)
-        self.setAutoFillBackground(True)
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, self.background_image.size() != self.size())
+        painter.drawPixmap(self.rect(), self.background_image)
+        painter.end()
 
-        # Timer for updating remaining time
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_time)
-        self.timer.start(16)  # ~60 FPS
+    def resident_pixmap_bytes(self):
+        """Memory held for this scene: its pixmap and any cached source"""
+        return AssetCache.pixmap_bytes(self.background_image) + AssetCache.instance().source_bytes(self.SOURCE_IMAGES)
 
-    def update_time(self):
+    def update_time(self, delta=GameClock.FRAME_MS):
         """Update the remaining time"""
-        if self.paused or not self.order_start_time:
+        if self.paused or self.order_start_time is None:
             return
-        current_time = QTime.currentTime()
-        elapsed_time = self.order_start_time.msecsTo(current_time)
+        elapsed_time = self.clock.now() - self.order_start_time
         self.remaining_time = max(0, self.seconds_to_order * 1000 - elapsed_time)
 
     def get_remaining_time(self):
@@ -53,11 +64,11 @@ class Kitchen(QWidget):
     def set_order_time(self, time):
         """Set the order time in seconds"""
         self.seconds_to_order = time
-        if not self.paused and not self.order_start_time:
-            self.order_start_time = QTime.currentTime()
+        if not self.paused and self.order_start_time is None:
+            self.order_start_time = self.clock.now()
 
     def set_paused(self, paused):
         """Set the pause state"""
         self.paused = paused
-        if not paused and not self.order_start_time:
-            self.order_start_time = QTime.currentTime()
\ No newline at end of file
+        if not paused and self.order_start_time is None:
+            self.order_start_time = self.clock.now()
\ No newline at end of file
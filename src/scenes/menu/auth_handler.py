@@ -1,23 +1,40 @@
+import json
+import threading
+import time
 from PyQt6.QtWidgets import QMainWindow, QStackedWidget
-from PyQt6.QtCore import Qt, QSettings, pyqtSignal
+from PyQt6.QtCore import Qt, QSettings, QTimer, pyqtSignal
 from PyQt6.QtGui import QPalette, QColor
 import pyrebase
 
 from src.core.logic.firebase_crud import FirebaseCRUD
+from src.core.logic.token_manager import token_expiry
 from src.components.login import UserAuth
 from src.components.user_page import UserPage
 from src.components.register import Register
 from src.components.forgot_password import ForgotPassword
 
+# Give up on restoring the saved session after this long and continue signed out
+SESSION_RESTORE_TIMEOUT_MS = 8000
+
 class AuthHandler(QMainWindow):
     user_logged_in = pyqtSignal()
     user_logged_out = pyqtSignal()
+    session_restore_finished = pyqtSignal()
+    _session_restored = pyqtSignal(int, object, str, bool)  # restore id, user or None, error, token rejected; from the worker
 
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, fdb=None, leaderboard=None, store=None, sync=None):
         super().__init__(parent)
         self.parent = parent
         self.current_user = None
-        self.fdb = FirebaseCRUD()
+        self.restoring = False
+        self.restore_id = 0
+        self._session_restored.connect(self._on_session_restored)
+        self.fdb = fdb if fdb is not None else FirebaseCRUD()
+        self.leaderboard = leaderboard
+        self.store = store  # LocalStore, so the profile shows without a network round trip
+        self.sync = sync
+        self.fdb.tokens.refreshed.connect(self._on_tokens_refreshed)
+        self.fdb.tokens.expired.connect(self._on_session_expired)
         self.settings = QSettings("Th1nkItThr0", "Dr1veThr0")
         self.setup_ui()
         self.stacked_layout_initialization()
@@ -55,10 +72,39 @@ class AuthHandler(QMainWindow):
         super().showEvent(event)
 
     def load_session(self):
+        """Restore the saved session in the background; user_logged_in is emitted if it succeeds"""
         refresh_token = self.settings.value("refresh_token", defaultValue=None)
-        if refresh_token:
+        self.switch_to_login()
+        if not refresh_token:
+            return
+        cached = self._cached_session(refresh_token)
+        if cached:
+            # Saved ID token is still valid: signed in without any request, the
+            # TokenManager refreshes it in the background before it expires
+            self.set_current_user(cached)
+            self.user_page.update_user_data()
+            self.switch_to_user_page()
+            return
+        self.restoring = True
+        self.restore_id += 1
+        restore_id = self.restore_id
+        # QSettings is read here on the GUI thread; the worker only gets the values.
+        # Daemon thread, so a request hanging on a dead network cannot keep the game from quitting
+        threading.Thread(
+            target=self._restore_session, args=(restore_id, refresh_token, self._cached_profile()), daemon=True
+        ).start()
+        QTimer.singleShot(SESSION_RESTORE_TIMEOUT_MS, lambda: self._on_restore_timeout(restore_id))
+
+    def _restore_session(self, restore_id, refresh_token, cached):
+        """Runs on the worker thread; only talks to Firebase and reports back through a signal"""
+        user, error, rejected = None, "", False
+        try:
             refreshed = self.fdb.refresh_user(refresh_token)
-            if refreshed and 'idToken' in refreshed:
+            rejected = refreshed == "TOKEN_EXPIRED"
+            if refreshed and 'idToken' in refreshed and cached.get('localId') == refreshed.get('userId'):
+                # Profile saved with the session; no account info request needed
+                user = dict(cached, idToken=refreshed['idToken'], refreshToken=refreshed['refreshToken'])
+            elif refreshed and 'idToken' in refreshed:
                 id_token = refreshed['idToken']
                 account_info = self.fdb.get_account_info(id_token)
                 if account_info and 'users' in account_info and len(account_info['users']) > 0:
@@ -70,24 +116,86 @@ class AuthHandler(QMainWindow):
                         'email': user_details['email'],
                         'displayName': user_details.get('displayName', '')
                     }
-                    self.set_current_user(user)
-                    self.user_page.update_user_data()  # Ensure data is updated on session load
-                    self.switch_to_user_page()
-                    self.user_logged_in.emit()
                 else:
-                    print("No user info found or invalid account info")
-                    self.settings.remove("refresh_token")
-                    self.switch_to_login()
+                    # An answer without the user means the account is gone; None is a failed request
+                    rejected = account_info is not None
+                    error = "No user info found or invalid account info"
             else:
-                print("Token refresh failed or invalid refresh response")
-                self.settings.remove("refresh_token")
-                self.switch_to_login()
+                error = "Token refresh failed or invalid refresh response"
+        except Exception as e:
+            error = f"Session restore failed: {e}"
+        self._session_restored.emit(restore_id, user, error, rejected)
+
+    def _on_session_restored(self, restore_id, user, error, rejected):
+        if restore_id != self.restore_id or not self.restoring:
+            return  # Timed out already; the player continued signed out
+        self.restoring = False
+        if self.is_user_logged_in():
+            pass  # Logged in by hand while the restore was running
+        elif user:
+            self.set_current_user(user)
+            self.user_page.update_user_data()  # Ensure data is updated on session load
+            self.switch_to_user_page()
+            self.user_logged_in.emit()
         else:
-            self.switch_to_login()
+            print(error)
+            if rejected:
+                self.settings.remove("refresh_token")
+            # Otherwise keep it, like on a timeout: offline now does not mean signed out
+        self.session_restore_finished.emit()
+
+    def _on_restore_timeout(self, restore_id):
+        if restore_id != self.restore_id or not self.restoring:
+            return
+        self.restoring = False
+        # Keep the refresh token: a slow network does not mean the session is invalid
+        print(f"Session restore timed out after {SESSION_RESTORE_TIMEOUT_MS // 1000}s, continuing signed out")
+        self.session_restore_finished.emit()
 
     def set_current_user(self, user):
         self.current_user = user
         self.settings.setValue("refresh_token", user['refreshToken'])
+        self.settings.setValue("id_token", user['idToken'])
+        self.settings.setValue("session_user", json.dumps({
+            key: user.get(key, '') for key in ('localId', 'email', 'displayName')
+        }))
+        self.fdb.tokens.set_tokens(user['idToken'], user['refreshToken'])
+        if self.leaderboard is not None:
+            self.leaderboard.set_name(user['localId'], user.get('displayName'))
+        if self.sync is not None:
+            self.sync.sync_user(user['localId'])
+
+    def _cached_profile(self):
+        try:
+            return json.loads(self.settings.value("session_user", defaultValue="{}"))
+        except (TypeError, ValueError):
+            return {}
+
+    def _cached_session(self, refresh_token):
+        """Saved user if its ID token is valid for at least another minute, else None"""
+        id_token = self.settings.value("id_token", defaultValue=None)
+        profile = self._cached_profile()
+        if not id_token or not profile.get('localId') or token_expiry(id_token) - time.time() < 60:
+            return None
+        return dict(profile, idToken=id_token, refreshToken=refresh_token)
+
+    def _on_tokens_refreshed(self, tokens):
+        if self.current_user is None:
+            return
+        self.current_user.update(tokens)
+        self.settings.setValue("refresh_token", tokens['refreshToken'])
+        self.settings.setValue("id_token", tokens['idToken'])
+
+    def _on_session_expired(self):
+        if self.current_user is not None:
+            print("Session expired, please log in again")
+            self.logout()
+            self.user_logged_out.emit()
+
+    def valid_id_token(self):
+        """ID token of the signed-in player, refreshed first only if it is about to expire"""
+        token, _ = self.fdb.ensure_valid_token(self.current_user)
+        return token
 
     def get_current_user(self):
         return self.current_user
@@ -95,6 +203,9 @@ class AuthHandler(QMainWindow):
     def logout(self):
         self.current_user = None
         self.settings.remove("refresh_token")
+        self.settings.remove("id_token")
+        self.settings.remove("session_user")
+        self.fdb.tokens.clear()
         self.switch_to_login()
     def is_user_logged_in(self):
         return self.current_user is not None and 'idToken' in self.current_user
@@ -4,25 +4,44 @@ from PyQt6.QtGui import QPixmap, QFont, QPalette, QBrush
 import sys
 
 from src.core.logic.abstract_functions import get_resource_path
+from src.core.logic.asset_cache import AssetCache
 from src.scenes.menu.auth_handler import AuthHandler
 from src.components.overlay_button import OverlayButton
 from src.components.overlay_label import OverlayLabel
-from src.scenes.test import Test
 from src.overlays.game_modes import GameModes
 from src.overlays.help import Help
 
 class Menu(QMainWindow):
-    def __init__(self, parent=None):
-        super().__init__()
-        self.auth_handler = AuthHandler(self)  # Initialize AuthHandler to check session
+    def __init__(self, parent=None, services=None):
+        super().__init__(parent)
+        self.services = services
+        self.leaderboard = services.leaderboard if services else None
+        self.auth_handler = AuthHandler(
+            self, fdb=services.fdb if services else None, leaderboard=self.leaderboard,
+            store=services.store if services else None, sync=services.sync if services else None
+        )  # Initialize AuthHandler to check session
         self._setup_ui()
         self._initialize_elements()
 
         # Connect signals for dynamic updates
         self.auth_handler.user_logged_in.connect(self.update_auth_button)
         self.auth_handler.user_logged_out.connect(self.update_auth_button)
+        self.auth_handler.session_restore_finished.connect(self.update_auth_button)
 
-        self.showFullScreen()
+        if parent is None:
+            self.showFullScreen()
+
+        # Open the camera and load the models while the player is still in the menu
+        if services:
+            self.perception_loader = services.perception
+        else:
+            from src.core.logic.perception import PerceptionLoader
+            self.perception_loader = PerceptionLoader.instance()
+        self.perception_loader.progress.connect(self.update_start_progress)
+        self.perception_loader.ready.connect(self.start_pending_game)
+        self.perception_loader.failed.connect(self.start_pending_game)
+        self.game_pending = False
+        self.perception_loader.start()
 
     def _initialize_elements(self):
         # Create the main widget and layout
@@ -90,6 +109,18 @@ class Menu(QMainWindow):
         buttons_layout.addWidget(buttons_column, alignment=Qt.AlignmentFlag.AlignLeft)
         buttons_layout.addStretch()
 
+        # Top scores of the selected mode, read from the leaderboard cache
+        self.leaderboard_label = OverlayLabel("", path=get_resource_path("img/timer.jpg"))
+        font = QFont()
+        font.setPointSize(int(self.height * 0.018))
+        self.leaderboard_label.setFont(font)
+        self.leaderboard_label.setMinimumSize(int(self.width * 0.22), int(self.height * 0.4))
+        buttons_layout.addWidget(self.leaderboard_label, alignment=Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignTop)
+        if self.leaderboard is not None:
+            self.leaderboard.updated.connect(self.update_leaderboard)
+        else:
+            self.leaderboard_label.hide()
+
         # Credit label
         self.credit = OverlayLabel("Made by Lorincz Dora-Kinga")
         self.credit.setAlignment(Qt.AlignmentFlag.AlignRight)
@@ -116,6 +147,7 @@ class Menu(QMainWindow):
         main_layout.setContentsMargins(int(self.width * 0.015), int(self.height * 0.02), int(self.width * 0.015), int(self.height * 0.02))
         self.resizeEvent = self.handle_resize_event
         self.game_modes_overlay.set_active_mode(self.current_game_mode)
+        self.refresh_leaderboard()
 
     def _setup_ui(self):
         self.setWindowTitle("Menu")
@@ -128,12 +160,7 @@ class Menu(QMainWindow):
         self.resize_background()
 
     def resize_background(self):
-        background_image_path = get_resource_path("img/lobby.jpg")
-        pixmap = QPixmap(background_image_path).scaled(
-            self.size(),
-            Qt.AspectRatioMode.IgnoreAspectRatio,
-            Qt.TransformationMode.SmoothTransformation
-        )
+        pixmap = AssetCache.instance().pixmap("img/lobby.jpg", self.size())
         palette = self.palette()
         palette.setBrush(self.backgroundRole(), QBrush(pixmap))
         self.setPalette(palette)
@@ -151,14 +178,61 @@ class Menu(QMainWindow):
         self.current_game_mode = mode
         self.game_modes_overlay.set_active_mode(mode)
         print(f"Game mode changed to: {mode}")
+        self.refresh_leaderboard()
+
+    def refresh_leaderboard(self):
+        """Show the cached board of the current mode and follow it live while the menu is up"""
+        if self.leaderboard is None:
+            return
+        self.update_leaderboard(self.current_game_mode)
+        self.leaderboard.watch(self.current_game_mode)
+
+    def stop_leaderboard(self):
+        """Close the live stream; the game does not show the board"""
+        if self.leaderboard is not None:
+            self.leaderboard.unwatch()
+
+    def update_leaderboard(self, mode):
+        if self.leaderboard is None or mode != self.current_game_mode:
+            return
+        title = mode.replace("_", " ").title()
+        self.leaderboard_label.setText(f"Top {title}\n{self.leaderboard.format(mode, limit=5)}")
 
     def open_game_fn(self):
+        if not self.perception_loader.is_ready() and self.perception_loader.warmup_thread is not None:
+            # Start as soon as warm-up is done instead of blocking the UI
+            self.game_pending = True
+            self.start.setEnabled(False)
+            self.update_start_progress(self.perception_loader.percent, "Loading camera")
+            return
+        self.open_game()
+
+    def update_start_progress(self, percent, message):
+        if self.game_pending:
+            self.start.setText(f"Loading... {percent}%")
+
+    def start_pending_game(self, *args):
+        if self.game_pending:
+            self.game_pending = False
+            self.start.setText("Start")
+            self.start.setEnabled(True)
+            self.open_game()
+
+    def open_game(self):
         print(f"Starting game with {self.current_game_mode} mode")
-        self.game = Test(auth_handler=self.auth_handler, current_game_mode=self.current_game_mode)        
-        if hasattr(self.game, 'set_game_mode'):
-            self.game.set_game_mode(self.current_game_mode)
+        from src.scenes.app_shell import AppShell
+        shell = AppShell.instance()
+        if shell is not None:
+            shell.start_game(self.current_game_mode)
+            return
+        # Standalone menu: the game gets its own full screen window, reused for every round
+        if getattr(self, 'game', None) is None:
+            from src.scenes.test import Test
+            self.game = Test(auth_handler=self.auth_handler, current_game_mode=self.current_game_mode, services=self.services)
+        self.stop_leaderboard()
         self.game.showFullScreen()
-        self.close()
+        self.game.start_round(self.current_game_mode)
+        self.hide()
 
     def game_modes_fn(self):
         print("Game Modes button clicked")
@@ -177,6 +251,11 @@ class Menu(QMainWindow):
         if self.auth_handler.is_user_logged_in():
             self.auth.setText("Already logged in")
             self.auth.clicked.connect(self.open_user_page)
+        elif self.auth_handler.restoring:
+            # Saved session is still being restored in the background
+            self.auth.setText("Signing in...")
+            self.auth.setEnabled(False)
+            self.auth.clicked.connect(self.auth_fn)
         else:
             self.auth.setText("Log in / Sign up")
             self.auth.clicked.connect(self.auth_fn)
@@ -206,6 +285,7 @@ class Menu(QMainWindow):
         self.auth_handler.raise_()
 
     def update_auth_button(self):
+        self.auth.setEnabled(True)
         if self.auth_handler.is_user_logged_in():
             self.auth.setText("Already logged in")
             self.auth.clicked.disconnect()
@@ -6,9 +6,10 @@ from PyQt6.QtWidgets import (
     QStackedLayout, QFrame, QSizePolicy
 )
 from PyQt6.QtGui import QIcon, QFont, QPixmap, QPainter, QColor
-from PyQt6.QtCore import Qt, QPoint, QTimer, QTime
+from PyQt6.QtCore import Qt, QPoint
 
 from src.core.logic.abstract_functions import get_resource_path
+from src.core.logic.game_clock import GameClock
 from src.components.overlay_label import OverlayLabel
 from src.components.overlay_button import OverlayButton
 from src.components.daily_deals import DailyDealsLabel
@@ -17,19 +18,28 @@ from src.overlays.pause import Pause
 from src.core.logic.elaborate_answer import ElaborateAnswer
 from .drivethru.whole_drivehtru_window import WholeDriveThruWindow
 from .kitchen.kitchen import Kitchen
-from src.components.camera import Camera_Widget
 
 class Test(QWidget):
-    def __init__(self, auth_handler, current_game_mode=None):
-        super().__init__()
+    def __init__(self, auth_handler, current_game_mode=None, parent=None, services=None):
+        super().__init__(parent)
         self.auth_handler = auth_handler
+        self.services = services
         self.current_game_mode = current_game_mode
         self.highscore = self.get_user_highscore()
+        if services:
+            self.highscores = services.highscores
+        else:
+            from src.core.logic.highscore_queue import HighscoreQueue
+            self.highscores = HighscoreQueue(self.auth_handler.fdb, parent=self)
+        self.highscores.confirmed.connect(self.highscore_confirmed)
+        self.clock = GameClock(self)
         self._setup_screen()
         self._initialize_ui()
         self._setup_overlays()
         self._configure_initial_state()
-        self.showFullScreen()
+        self.clock.start()
+        if parent is None:
+            self.showFullScreen()
 
     def _setup_screen(self):
         screen = QApplication.primaryScreen()
@@ -53,13 +63,25 @@ class Test(QWidget):
         self.main_layout.addWidget(self.game_container)
 
     def _add_scenes(self):
-        self.scene1_widget = WholeDriveThruWindow(width=self.screen_width, height=self.screen_height)
-        self.scene2_widget = Kitchen(width=self.screen_width, height=self.screen_height)
+        self.scene1_widget = WholeDriveThruWindow(width=self.screen_width, height=self.screen_height, clock=self.clock)
+        self.scene2_widget = None  # Kitchen is built the first time the player switches to it
         self.stacked_layout.addWidget(self.scene1_widget)
-        self.stacked_layout.addWidget(self.scene2_widget)
         self.current_scene = "drive_thru"
         self.stacked_layout.setCurrentIndex(0)
 
+    def _ensure_kitchen(self):
+        if self.scene2_widget is None:
+            self.scene2_widget = Kitchen(width=self.screen_width, height=self.screen_height, clock=self.clock)
+            if not self.game_playing:
+                self.scene2_widget.set_paused(True)
+            self.stacked_layout.addWidget(self.scene2_widget)
+        return self.scene2_widget
+
+    def resident_scene_bytes(self):
+        """Pixmap memory held by each constructed scene"""
+        scenes = {"drive_thru": self.scene1_widget, "kitchen": self.scene2_widget}
+        return {name: scene.resident_pixmap_bytes() for name, scene in scenes.items() if scene is not None}
+
     def _setup_overlays(self):
         self.daily_deals = DailyDealsLabel(self, current_game_mode=self.current_game_mode)
         self.daily_deals.move(self.screen_width - self.daily_deals.width() - 50, 310)
@@ -67,7 +89,13 @@ class Test(QWidget):
         self.customer_order = CustomerOrder(self)
         self.customer_order.move(350, 350)
 
-        self.camera_widget = Camera_Widget(self)
+        from src.components.camera import Camera_Widget  # Pulls in cv2 and mediapipe
+        if self.services:
+            perception_loader = self.services.perception
+        else:
+            from src.core.logic.perception import PerceptionLoader
+            perception_loader = PerceptionLoader.instance()
+        self.camera_widget = Camera_Widget(self, perception=perception_loader.take())
         self.elaborate_answer = ElaborateAnswer(self)
         self.elaborate_answer.resize(self.screen_width, self.screen_height)
 
@@ -93,11 +121,8 @@ class Test(QWidget):
         self.pause_game.resize(self.screen_width, self.screen_height)
         self.pause_game.hide()
 
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.update_time_display)
-        self.update_timer.start(1000 // 60)
-
-        self.game_start_time = QTime.currentTime()
+        # HUD is refreshed last in each tick, after the car and the order countdown
+        self.clock.subscribe(self.update_time_display, GameClock.HUD)
 
     def _configure_initial_state(self):
         self.had_active_order = False
@@ -112,6 +137,28 @@ class Test(QWidget):
         for widget in [self.change_button, self.timer_label, self.daily_deals, self.customer_order, self.score_label]:
             widget.raise_()
 
+    def start_round(self, mode):
+        """Reset the reused game scene for a new round in the given mode"""
+        self.current_game_mode = mode
+        self.highscore = self.get_user_highscore()
+        self.pause_game.hide()
+        self.elaborate_answer.reset()
+        if self.current_scene == "kitchen":
+            self.toggle_scenes()
+        if not self.game_playing:
+            self.toggle_pause()
+        self.clock.resume()
+        self.reset_score_display()
+        self.had_active_order = False
+        self.reset_timer()
+        self.set_game_mode(mode)
+        self.camera_widget.timer.start(30)
+
+    def stop_round(self):
+        """Freeze the game clock and the camera while the menu is shown"""
+        self.clock.pause()
+        self.camera_widget.timer.stop()
+
     def set_game_mode(self, mode):
         self.current_game_mode = mode
         self.daily_deals.current_game_mode = mode
@@ -137,7 +184,8 @@ class Test(QWidget):
         self._set_order_time(config["time"])
         self.validate_code_button.setText(config["button_text"])
         self.validate_code_button.setEnabled(config["enabled"])
-        if config["hands"] > 1 and hasattr(self.camera_widget, 'update_number_of_hands'):
+        # Set every round: the camera and its detector are reused across rounds and modes
+        if hasattr(self.camera_widget, 'update_number_of_hands'):
             self.camera_widget.update_number_of_hands(config["hands"])
 
         self.code = self.decimal_code if self.current_game_mode == "reverse" else self.decimal_to_binary_array(self.decimal_code)
@@ -149,7 +197,7 @@ class Test(QWidget):
 
     def _set_order_time(self, seconds):
         self.scene1_widget.seconds_to_order = seconds
-        self.scene1_widget.order_start_time = QTime.currentTime()
+        self.scene1_widget.order_start_time = self.clock.now()
 
     def setup_camera(self):
         camera_width = self.camera_widget.width()
@@ -166,54 +214,58 @@ class Test(QWidget):
 
     def keyPressEvent(self, event):
         if event.key() == Qt.Key.Key_Escape and self.elaborate_answer.isHidden():
-            self.last_pause_time = QTime.currentTime()
             self.toggle_pause(pause_overlay=True)
         super().keyPressEvent(event)
 
     def toggle_pause(self, pause_overlay=None):
-        current_time = QTime.currentTime()
         if self.game_playing:
             if hasattr(self.scene1_widget, 'get_remaining_time'):
                 self.paused_remaining_time = self.scene1_widget.get_remaining_time() / 1000
             self.timer_label.setText(f"Time: {self.paused_remaining_time:.1f}s")
             self.timer_label.update()
             self.scene1_widget.set_paused(True)
-            self.scene2_widget.set_paused(True)
-            self.update_timer.stop()
+            if self.scene2_widget:
+                self.scene2_widget.set_paused(True)
+                self.scene2_widget.lower()
+            self.clock.pause()
             self.scene1_widget.lower()
-            self.scene2_widget.lower()
             if pause_overlay:
                 self.pause_game.show()
                 self.pause_game.raise_()
             self.score_label.raise_()
             self.timer_label.raise_()
-            self.pause_start_time = current_time
-            print(f"Game paused at {current_time.toString('hh:mm:ss.zzz')} with {self.paused_remaining_time:.1f}s remaining")
+            self.pause_start_time = time.monotonic()
+            print(f"Game paused at {self.clock.now() / 1000:.1f}s game time with {self.paused_remaining_time:.1f}s remaining")
         else:
-            pause_duration = self.pause_start_time.msecsTo(current_time)
+            pause_duration = int((time.monotonic() - self.pause_start_time) * 1000)
             print(f"Game resumed after {pause_duration}ms pause with {self.paused_remaining_time:.1f}s remaining")
-            order_window = self.scene1_widget.order_window
-            if order_window.middle_reached:
-                new_order_start_time = QTime.currentTime().addMSecs(-int((order_window.seconds_to_order - self.paused_remaining_time) * 1000))
-                order_window.order_start_time = new_order_start_time
+            # Game time stood still while paused, so the order countdown resumes where it stopped
             self.scene1_widget.set_paused(False)
-            self.scene2_widget.set_paused(False)
-            self.update_timer.start()
+            self.clock.resume()
             self.scene1_widget.raise_()
-            self.scene2_widget.raise_()
+            if self.scene2_widget:
+                self.scene2_widget.set_paused(False)
+                self.scene2_widget.raise_()
             self.pause_game.hide()
         self.game_playing = not self.game_playing
 
     def back_to_menu(self):
-        from src.scenes.menu.menu_window import Menu
-        self.menu = Menu()
-        self.menu.show()
-        self.close()
+        from src.scenes.app_shell import AppShell
+        shell = AppShell.instance()
+        if shell is not None:
+            shell.show_menu()
+            return
+        # Started from a standalone Menu
+        self.stop_round()
+        self.hide()
+        menu = self.auth_handler.parent
+        menu.showFullScreen()
+        menu.refresh_leaderboard()
 
     def toggle_scenes(self):
         self.elaborate_answer.hide()
         if self.current_scene == "drive_thru":
-            self.stacked_layout.setCurrentIndex(1)
+            self.stacked_layout.setCurrentWidget(self._ensure_kitchen())
             self.current_scene = "kitchen"
             self._update_kitchen_ui()
             self.change_button.flip_image()
@@ -261,7 +313,7 @@ class Test(QWidget):
         self.customer_order.update_menu_image()
         self.camera_widget.update_true_code(self.code)
 
-    def update_time_display(self):
+    def update_time_display(self, delta=GameClock.FRAME_MS):
         if not self.game_playing:
             self.timer_label.text = f"Time: {self.paused_remaining_time:.1f}s"
             self.timer_label.update()
@@ -296,8 +348,8 @@ class Test(QWidget):
         order_window = self.scene1_widget.order_window
         order_window.reset_timer()
         order_window.middle_reached = False
-        order_window.order_start_time = QTime.currentTime()
-        order_window.x -= order_window.speed
+        order_window.order_start_time = self.clock.now()
+        order_window.move_car(order_window.x - order_window.speed)
         self.remaining_time = 0
         self.timer_label.text = f"Time: {self.remaining_time:.1f}s"
         self.timer_label.update()
@@ -344,6 +396,8 @@ class Test(QWidget):
         user = self.auth_handler.get_current_user()
         if user:
             uid = user.get('localId') or user.get('uid')
+            if uid and self.auth_handler.store is not None:
+                return self.auth_handler.store.best_score(uid, self.current_game_mode)
             if uid:
                 return self.auth_handler.fdb.get_user_highscore_by_mode(uid, self.current_game_mode)
         return 999
@@ -355,13 +409,24 @@ class Test(QWidget):
         game_mode = self.current_game_mode
         highscore_key = f'{game_mode}_mode_highscore'
         print(highscore_key)
+        uid = self.auth_handler.current_user['localId']
         current_highscore = self.auth_handler.current_user.get(highscore_key, 0)
+        if self.auth_handler.store is not None:
+            current_highscore = max(current_highscore, self.auth_handler.store.best_score(uid, game_mode))
         if current_score > current_highscore:
-            uid = self.auth_handler.current_user['localId']
             email = self.auth_handler.current_user['email']
-            self.auth_handler.fdb.update_highscore(uid, game_mode, current_score, email)
+            if self.auth_handler.store is not None:
+                self.auth_handler.store.record_score(uid, game_mode, current_score)
+            # Written in the background; game over does not wait for the server
+            self.highscores.submit(uid, game_mode, current_score, email)
             self.auth_handler.current_user[highscore_key] = current_score
             return True
         return False
 
+    def highscore_confirmed(self, uid, game_mode, score):
+        print(f"Server confirmed {game_mode} highscore {score}")
+        user = self.auth_handler.current_user
+        if user and user.get('localId') == uid and game_mode == self.current_game_mode:
+            self.highscore = max(score, self.highscore or 0)
+
     
\ No newline at end of file
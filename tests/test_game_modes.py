@@ -0,0 +1,37 @@
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("PyQt6")
+
+from src.scenes.test import Test as GameScene
+
+class RecordingCamera:
+    def __init__(self):
+        self.number_of_hands = 1
+
+    def update_number_of_hands(self, number_of_hands):
+        self.number_of_hands = number_of_hands
+
+def make_scene(camera):
+    return SimpleNamespace(
+        current_game_mode=None,
+        camera_widget=camera,
+        decimal_code=5,
+        validate_code_button=SimpleNamespace(setText=lambda text: None, setEnabled=lambda enabled: None),
+        _set_order_time=lambda seconds: None,
+        decimal_to_binary_array=lambda code: [],
+        update_orders=lambda: None,
+    )
+
+def test_hands_follow_the_mode_when_the_scene_is_reused():
+    camera = RecordingCamera()
+    scene = make_scene(camera)
+
+    scene.current_game_mode = "double_trouble"
+    GameScene._configure_mode_settings(scene)
+    assert camera.number_of_hands == 2
+
+    scene.current_game_mode = "default"
+    GameScene._configure_mode_settings(scene)
+    assert camera.number_of_hands == 1